@@ -13,15 +13,199 @@ Replaces multiple platform-specific installers with a single Python solution.
 """
 
 import os
+import re
 import sys
-import json
-import shutil
+import stat
+import functools
+import datetime
 import platform
+import shutil
 import argparse
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to stdlib json
+    orjson = None
+
+
+# Chunk size for the userspace fallback copy loop
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _kernel_copy(infd: int, outfd: int, size: int) -> bool:
+    """Copy ``size`` bytes between descriptors in-kernel (Linux only).
+
+    Tries ``copy_file_range`` (which allows reflinks on CoW/NFS filesystems)
+    and then ``sendfile``. Returns False if neither is usable so the caller
+    can fall back to a plain read/write loop.
+    """
+    methods = []
+    if hasattr(os, 'copy_file_range'):
+        methods.append(lambda count: os.copy_file_range(infd, outfd, count))
+    if hasattr(os, 'sendfile'):
+        methods.append(lambda count: os.sendfile(outfd, infd, None, count))
+
+    for method in methods:
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = method(remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return True
+        except OSError:
+            # Unsupported for this fd pair - rewind and try the next method
+            os.lseek(infd, 0, os.SEEK_SET)
+            os.lseek(outfd, 0, os.SEEK_SET)
+            os.ftruncate(outfd, 0)
+
+    return False
+
+
+def _fast_copy(src, dst):
+    """Drop-in replacement for ``shutil.copy2`` with a kernel fast path on Linux.
+
+    Other platforms use ``shutil.copyfile``, which already delegates to the
+    native copy primitive on macOS and Windows.
+    """
+    if sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            if not _kernel_copy(infd, outfd, os.fstat(infd).st_size):
+                buffer = bytearray(COPY_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    n = fsrc.readinto(buffer)
+                    if not n:
+                        break
+                    fdst.write(view[:n])
+    else:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_content_only(src: Path, dst: Path) -> Path:
+    """Copy file contents without propagating mtime/permission metadata.
+
+    Small files are copied with one read and one write; anything larger
+    goes through ``_fast_copy``.
+    """
+    if src.stat().st_size < COPY_CHUNK_SIZE:
+        dst.write_bytes(src.read_bytes())
+    else:
+        _fast_copy(src, dst)
+    return dst
+
+
+def _load_json_file(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    import json
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json_file(path: Path, data) -> None:
+    """Write data as 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    import json
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# Claude Code hook events mapped to (script relative to hooks dir, timeout in seconds)
+HOOK_CONFIG_TEMPLATE: Dict[str, Tuple[str, int]] = {
+    'SessionStart': ('core/session-start.js', 10),
+    'SessionEnd': ('core/session-end.js', 15),
+    'UserPromptSubmit': ('core/mid-conversation.js', 8),
+}
+
+# Hook scripts that identify an existing memory awareness hook in settings.json
+MEMORY_HOOK_MARKERS = ('session-start.js', 'session-end.js', 'mid-conversation.js')
+MEMORY_HOOK_PATTERN = re.compile('|'.join(re.escape(marker) for marker in MEMORY_HOOK_MARKERS))
+
+# Files removed by uninstall, grouped by directory relative to the hooks dir
+UNINSTALL_FILES = {
+    'core': frozenset({
+        'session-start.js',
+        'session-end.js',
+        'mid-conversation.js',
+        'memory-retrieval.js',
+        'topic-change.js',
+    }),
+    'utilities': frozenset({
+        'adaptive-pattern-detector.js',
+        'performance-manager.js',
+        'mcp-client.js',
+        'memory-client.js',
+        'tiered-conversation-monitor.js',
+    }),
+    '': frozenset({
+        'memory-mode-controller.js',
+        'test-natural-triggers.js',
+        'test-mcp-hook.js',
+        'debug-pattern-test.js',
+    }),
+}
+
+# Version probes run by check_prerequisites, in reporting order
+PREREQUISITE_PROBES = (
+    ('claude', ['claude', '--version']),
+    ('node', ['node', '--version']),
+)
+
+
+def _run_probe(cmd: List[str]):
+    """Run a prerequisite probe, returning the CompletedProcess or the exception raised."""
+    import subprocess
+
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return e
+
+
+@functools.lru_cache(maxsize=4096)
+def _exists(path: str) -> bool:
+    """Memoized ``os.path.exists``.
+
+    The installer is the only writer to the hooks tree while it runs, so
+    probe results stay valid until we mutate it ourselves; call
+    ``_exists.cache_clear()`` after any copy, mkdir or unlink.
+    """
+    return os.path.exists(path)
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """Stat a path once so existence and type checks can share the result."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_empty_dir(path: str) -> bool:
+    """Return True if the directory has no entries, reading at most one."""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+
+@functools.lru_cache(maxsize=None)
+def _home() -> Path:
+    """Memoized ``Path.home()``."""
+    return Path.home()
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -32,6 +216,47 @@ class Colors:
     CYAN = '\033[0;36m'
     NC = '\033[0m'  # No Color
 
+    # Precomposed messages for the top-level exception handlers
+    CANCELLED_MSG = f"\n{YELLOW}Installation cancelled by user{NC}\n"
+    ERROR_PREFIX = f"\n{RED}Unexpected error: "
+    ERROR_SUFFIX = f"{NC}\n"
+
+
+INFO_PREFIX = f"{Colors.GREEN}[INFO]{Colors.NC} "
+
+
+def _info_block(*lines: str) -> str:
+    """Precompose lines into one block formatted like HookInstaller.info output."""
+    return "".join(f"{INFO_PREFIX}{line}\n" for line in lines)
+
+
+# Multi-line messages from main(), composed once and written with a single call
+DRY_RUN_HEADER = _info_block(
+    "DRY RUN - No changes will be made",
+    "Would install:",
+)
+DRY_RUN_BASIC = _info_block(
+    "  - Basic memory awareness hooks",
+    "  - Core utilities and configuration",
+)
+DRY_RUN_NATURAL_TRIGGERS = _info_block(
+    "  - Natural Memory Triggers v7.1.3",
+    "  - Mid-conversation hooks",
+    "  - Performance optimization utilities",
+    "  - CLI management tools",
+)
+BASIC_AND_NT_BANNER = _info_block(
+    "Features available:",
+    "  ✅ Session-start and session-end hooks",
+    "  ✅ Natural Memory Triggers with intelligent pattern detection",
+    "  ✅ Mid-conversation memory injection",
+    "  ✅ Performance optimization and CLI management",
+    "",
+    "CLI Management:",
+    "  node {hooks_dir}/memory-mode-controller.js status",
+    "  node {hooks_dir}/memory-mode-controller.js profile balanced",
+)
+
 
 class HookInstaller:
     """Unified hook installer for all platforms and feature levels."""
@@ -41,10 +266,12 @@ class HookInstaller:
         self.platform_name = platform.system().lower()
         self.claude_hooks_dir = self._detect_claude_hooks_directory()
         self.backup_dir = None
+        # Set by check_prerequisites(); None until the probes have run
+        self.node_available = None
 
     def _detect_claude_hooks_directory(self) -> Path:
         """Detect the Claude Code hooks directory across platforms."""
-        home = Path.home()
+        home = _home()
 
         # Primary paths by platform
         primary_paths = {
@@ -66,18 +293,9 @@ class HookInstaller:
         platform_paths = primary_paths.get(self.platform_name, primary_paths['linux'])
 
         for path in platform_paths:
-            if path.exists():
+            if _exists(str(path)):
                 return path
 
-        # Check if Claude Code CLI can tell us the location
-        try:
-            result = subprocess.run(['claude', '--help'],
-                                  capture_output=True, text=True, timeout=5)
-            # Look for hooks directory info in help output
-            # This is a placeholder - actual Claude CLI might not provide this
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
         # Default to standard location
         return home / '.claude' / 'hooks'
 
@@ -103,43 +321,88 @@ class HookInstaller:
         print(f"{Colors.CYAN} {message}{Colors.NC}")
         print(f"{Colors.CYAN}{'=' * 60}{Colors.NC}\n")
 
+    def _collect_pairs(self, files: List[str], src_dir: Path, dst_dir: Path,
+                       missing_label: Optional[str] = None) -> List[Tuple[Path, Path]]:
+        """Pair each of files present in src_dir with its destination, listing src_dir once.
+
+        If missing_label is given, absent files are reported in a single warning.
+        """
+        try:
+            present = set(os.listdir(src_dir))
+        except OSError:
+            present = set()
+
+        missing = [file for file in files if file not in present]
+        if missing and missing_label:
+            self.warn(f"{missing_label} not found: {', '.join(missing)}")
+
+        return [(src_dir / file, dst_dir / file) for file in files if file in present]
+
+    def _copy_many(self, pairs: List[Tuple[Path, Path]], copy_function=_fast_copy) -> int:
+        """Copy (src, dst) pairs concurrently, warning per failing file instead of aborting.
+
+        Returns the number of files copied; callers compare it with len(pairs).
+        """
+        if not pairs:
+            return 0
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        copied = 0
+        with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+            futures = {executor.submit(copy_function, src, dst): src for src, dst in pairs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    copied += 1
+                except Exception as e:
+                    self.warn(f"Failed to copy {futures[future].name}: {e}")
+
+        _exists.cache_clear()
+        return copied
+
     def check_prerequisites(self) -> bool:
         """Check system prerequisites for hook installation."""
         self.info("Checking prerequisites...")
 
         all_good = True
 
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Dispatch all version probes at once; results are reported below in
+        # declaration order so the log output stays deterministic
+        with ThreadPoolExecutor(max_workers=len(PREREQUISITE_PROBES)) as executor:
+            futures = {name: executor.submit(_run_probe, cmd) for name, cmd in PREREQUISITE_PROBES}
+        results = {name: future.result() for name, future in futures.items()}
+
         # Check Claude Code CLI
-        try:
-            result = subprocess.run(['claude', '--version'],
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                self.success(f"Claude Code CLI found: {result.stdout.strip()}")
-            else:
-                self.warn("Claude Code CLI found but version check failed")
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
+        result = results['claude']
+        if isinstance(result, Exception):
             self.warn("Claude Code CLI not found in PATH")
             self.info("You can still install hooks, but some features may not work")
+        elif result.returncode == 0:
+            self.success(f"Claude Code CLI found: {result.stdout.strip()}")
+        else:
+            self.warn("Claude Code CLI found but version check failed")
 
         # Check Node.js
-        try:
-            result = subprocess.run(['node', '--version'],
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                major_version = int(version.replace('v', '').split('.')[0])
-                if major_version >= 14:
-                    self.success(f"Node.js found: {version} (compatible)")
-                else:
-                    self.error(f"Node.js {version} found, but version 14+ required")
-                    all_good = False
-            else:
-                self.error("Node.js found but version check failed")
-                all_good = False
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
+        result = results['node']
+        self.node_available = not isinstance(result, Exception) and result.returncode == 0
+        if isinstance(result, Exception):
             self.error("Node.js not found - required for hook execution")
             self.info("Please install Node.js 14+ from https://nodejs.org/")
             all_good = False
+        elif result.returncode == 0:
+            version = result.stdout.strip()
+            major_version = int(version.replace('v', '').split('.')[0])
+            if major_version >= 14:
+                self.success(f"Node.js found: {version} (compatible)")
+            else:
+                self.error(f"Node.js {version} found, but version 14+ required")
+                all_good = False
+        else:
+            self.error("Node.js found but version check failed")
+            all_good = False
 
         # Check Python version
         if sys.version_info < (3, 7):
@@ -152,20 +415,31 @@ class HookInstaller:
 
     def create_backup(self) -> None:
         """Create backup of existing hooks installation."""
-        if not self.claude_hooks_dir.exists():
+        if not _exists(str(self.claude_hooks_dir)):
             self.info("No existing hooks installation found - no backup needed")
             return
 
-        timestamp = subprocess.run(['date', '+%Y%m%d-%H%M%S'],
-                                 capture_output=True, text=True).stdout.strip()
-        if not timestamp:  # Fallback for Windows
-            import datetime
-            timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
 
         self.backup_dir = self.claude_hooks_dir.parent / f"hooks-backup-{timestamp}"
 
         try:
-            shutil.copytree(self.claude_hooks_dir, self.backup_dir)
+            # Recreate the directory tree first, then copy every file in one
+            # concurrent batch instead of copytree's serial per-file loop
+            self.backup_dir.mkdir(parents=True)
+            pairs = []
+            for root, dirs, files in os.walk(self.claude_hooks_dir, followlinks=True):
+                dst_root = self.backup_dir / os.path.relpath(root, self.claude_hooks_dir)
+                for name in dirs:
+                    (dst_root / name).mkdir()
+                pairs.extend((Path(root, name), dst_root / name) for name in files)
+
+            copied = self._copy_many(pairs)
+            if copied != len(pairs):
+                # Never report a partial backup as a good one right before overwriting
+                self.warn(f"Backup is INCOMPLETE: only {copied} of {len(pairs)} files copied to {self.backup_dir}")
+                self.warn("Files that failed to copy above will not be recoverable from this backup")
+                return
             self.success(f"Backup created: {self.backup_dir}")
         except Exception as e:
             self.warn(f"Failed to create backup: {e}")
@@ -176,10 +450,18 @@ class HookInstaller:
         self.info("Installing basic memory awareness hooks...")
 
         try:
+            core_src_dir, core_dst_dir = self.script_dir / "core", self.claude_hooks_dir / "core"
+            utilities_src_dir, utilities_dst_dir = self.script_dir / "utilities", self.claude_hooks_dir / "utilities"
+            tests_src_dir, tests_dst_dir = self.script_dir / "tests", self.claude_hooks_dir / "tests"
+
             # Create necessary directories
-            (self.claude_hooks_dir / "core").mkdir(parents=True, exist_ok=True)
-            (self.claude_hooks_dir / "utilities").mkdir(parents=True, exist_ok=True)
-            (self.claude_hooks_dir / "tests").mkdir(parents=True, exist_ok=True)
+            core_dst_dir.mkdir(parents=True, exist_ok=True)
+            utilities_dst_dir.mkdir(parents=True, exist_ok=True)
+            tests_dst_dir.mkdir(parents=True, exist_ok=True)
+            _exists.cache_clear()
+
+            # Collect all copies first so they can be dispatched as a single batch
+            pairs = []
 
             # Core hooks
             core_files = [
@@ -189,13 +471,7 @@ class HookInstaller:
                 "topic-change.js"
             ]
 
-            for file in core_files:
-                src = self.script_dir / "core" / file
-                dst = self.claude_hooks_dir / "core" / file
-                if src.exists():
-                    shutil.copy2(src, dst)
-                else:
-                    self.warn(f"Core file not found: {file}")
+            pairs.extend(self._collect_pairs(core_files, core_src_dir, core_dst_dir, "Core files"))
 
             # Basic utilities
             utility_files = [
@@ -209,26 +485,19 @@ class HookInstaller:
                 "git-analyzer.js"
             ]
 
-            for file in utility_files:
-                src = self.script_dir / "utilities" / file
-                dst = self.claude_hooks_dir / "utilities" / file
-                if src.exists():
-                    shutil.copy2(src, dst)
-                else:
-                    self.warn(f"Utility file not found: {file}")
+            pairs.extend(self._collect_pairs(utility_files, utilities_src_dir, utilities_dst_dir, "Utility files"))
 
             # Tests
             test_files = ["integration-test.js"]
-            for file in test_files:
-                src = self.script_dir / "tests" / file
-                dst = self.claude_hooks_dir / "tests" / file
-                if src.exists():
-                    shutil.copy2(src, dst)
+            pairs.extend(self._collect_pairs(test_files, tests_src_dir, tests_dst_dir))
 
             # Documentation
-            readme_src = self.script_dir / "README.md"
-            if readme_src.exists():
-                shutil.copy2(readme_src, self.claude_hooks_dir / "README.md")
+            pairs.extend(self._collect_pairs(["README.md"], self.script_dir, self.claude_hooks_dir))
+
+            # _copy_many warns about each failed file; any failure fails the install
+            if self._copy_many(pairs) != len(pairs):
+                self.error("Failed to install basic hooks: some files could not be copied")
+                return False
 
             self.success("Basic hooks installed successfully")
             return True
@@ -242,16 +511,19 @@ class HookInstaller:
         self.info("Installing Natural Memory Triggers v7.1.3...")
 
         try:
-            # Ensure directories exist
-            (self.claude_hooks_dir / "core").mkdir(parents=True, exist_ok=True)
-            (self.claude_hooks_dir / "utilities").mkdir(parents=True, exist_ok=True)
+            core_src_dir, core_dst_dir = self.script_dir / "core", self.claude_hooks_dir / "core"
+            utilities_src_dir, utilities_dst_dir = self.script_dir / "utilities", self.claude_hooks_dir / "utilities"
 
-            # Mid-conversation hook
-            mid_conv_src = self.script_dir / "core" / "mid-conversation.js"
-            if mid_conv_src.exists():
-                shutil.copy2(mid_conv_src, self.claude_hooks_dir / "core" / "mid-conversation.js")
-                self.success("Installed mid-conversation hooks")
-            else:
+            # Ensure directories exist
+            core_dst_dir.mkdir(parents=True, exist_ok=True)
+            utilities_dst_dir.mkdir(parents=True, exist_ok=True)
+            _exists.cache_clear()
+
+            # Collect all copies first so they can be dispatched as a single batch,
+            # starting with the mid-conversation hook
+            pairs = self._collect_pairs(["mid-conversation.js"], core_src_dir, core_dst_dir)
+            has_mid_conv = bool(pairs)
+            if not has_mid_conv:
                 self.warn("Mid-conversation hook not found")
 
             # v7.1.3 enhanced utilities
@@ -263,13 +535,8 @@ class HookInstaller:
                 "memory-client.js"
             ]
 
-            for file in enhanced_utilities:
-                src = self.script_dir / "utilities" / file
-                dst = self.claude_hooks_dir / "utilities" / file
-                if src.exists():
-                    shutil.copy2(src, dst)
-                else:
-                    self.warn(f"Enhanced utility not found: {file}")
+            pairs.extend(self._collect_pairs(enhanced_utilities, utilities_src_dir, utilities_dst_dir,
+                                             "Enhanced utilities"))
 
             # CLI management tools
             cli_tools = [
@@ -277,12 +544,6 @@ class HookInstaller:
                 "debug-pattern-test.js"
             ]
 
-            for file in cli_tools:
-                src = self.script_dir / file
-                dst = self.claude_hooks_dir / file
-                if src.exists():
-                    shutil.copy2(src, dst)
-
             # Test files
             test_files = [
                 "test-natural-triggers.js",
@@ -290,11 +551,19 @@ class HookInstaller:
                 "test-dual-protocol-hook.js"
             ]
 
-            for file in test_files:
-                src = self.script_dir / file
-                dst = self.claude_hooks_dir / file
-                if src.exists():
-                    shutil.copy2(src, dst)
+            # CLI tools and test scripts are only ever run via node, so their
+            # file metadata does not need to be preserved
+            content_only_pairs = self._collect_pairs(cli_tools + test_files, self.script_dir, self.claude_hooks_dir)
+
+            # Run both batches so every failed file is reported before failing
+            copied = self._copy_many(pairs)
+            copied += self._copy_many(content_only_pairs, copy_function=_copy_content_only)
+            if copied != len(pairs) + len(content_only_pairs):
+                self.error("Failed to install Natural Memory Triggers: some files could not be copied")
+                return False
+
+            if has_mid_conv:
+                self.success("Installed mid-conversation hooks")
 
             self.success("Natural Memory Triggers v7.1.3 installed successfully")
             return True
@@ -311,38 +580,36 @@ class HookInstaller:
             # Install template configuration
             template_src = self.script_dir / "config.template.json"
             template_dst = self.claude_hooks_dir / "config.template.json"
-            if template_src.exists():
-                shutil.copy2(template_src, template_dst)
+            if _exists(str(template_src)):
+                _fast_copy(template_src, template_dst)
 
             # Install main configuration
             config_src = self.script_dir / "config.json"
             config_dst = self.claude_hooks_dir / "config.json"
 
-            if config_dst.exists():
+            if _exists(str(config_dst)):
                 # Backup existing config
                 backup_config = config_dst.with_suffix('.json.backup')
-                shutil.copy2(config_dst, backup_config)
+                backup_config.write_bytes(config_dst.read_bytes())
                 self.info("Existing configuration backed up")
 
-            if config_src.exists():
-                shutil.copy2(config_src, config_dst)
-
-                # Update paths for current system
+            if _exists(str(config_src)):
+                # Update paths for current system in memory, then write once
                 try:
-                    with open(config_dst, 'r') as f:
-                        config = json.load(f)
+                    config = _load_json_file(config_src)
 
                     # Update server working directory path
                     if 'memoryService' in config and 'mcp' in config['memoryService']:
                         config['memoryService']['mcp']['serverWorkingDir'] = str(self.script_dir.parent)
 
-                    with open(config_dst, 'w') as f:
-                        json.dump(config, f, indent=2)
+                    _write_json_file(config_dst, config)
 
                     self.success("Configuration installed and updated for current system")
                 except Exception as e:
                     self.warn(f"Failed to update configuration paths: {e}")
+                    _fast_copy(config_src, config_dst)
 
+            _exists.cache_clear()
             return True
 
         except Exception as e:
@@ -351,11 +618,13 @@ class HookInstaller:
 
     def configure_claude_settings(self, install_mid_conversation: bool = False) -> bool:
         """Configure Claude Code settings.json for hook integration."""
+        import json
+
         self.info("Configuring Claude Code settings...")
 
         try:
             # Determine settings path based on platform
-            home = Path.home()
+            home = _home()
             if self.platform_name == 'windows':
                 settings_dir = home / 'AppData' / 'Roaming' / 'Claude'
             else:
@@ -364,60 +633,37 @@ class HookInstaller:
             settings_dir.mkdir(parents=True, exist_ok=True)
             settings_file = settings_dir / 'settings.json'
 
-            # Create hook configuration
+            # Create hook configuration; the mid-conversation hook is only
+            # added if Natural Memory Triggers are installed
             hook_config = {
                 "hooks": {
-                    "SessionStart": [
+                    hook_type: [
                         {
                             "hooks": [
                                 {
                                     "type": "command",
-                                    "command": f'node "{self.claude_hooks_dir}/core/session-start.js"',
-                                    "timeout": 10
-                                }
-                            ]
-                        }
-                    ],
-                    "SessionEnd": [
-                        {
-                            "hooks": [
-                                {
-                                    "type": "command",
-                                    "command": f'node "{self.claude_hooks_dir}/core/session-end.js"',
-                                    "timeout": 15
+                                    "command": f'node "{self.claude_hooks_dir}/{script}"',
+                                    "timeout": timeout
                                 }
                             ]
                         }
                     ]
+                    for hook_type, (script, timeout) in HOOK_CONFIG_TEMPLATE.items()
+                    if install_mid_conversation or hook_type != 'UserPromptSubmit'
                 }
             }
 
-            # Add mid-conversation hook if Natural Memory Triggers are installed
-            if install_mid_conversation:
-                hook_config["hooks"]["UserPromptSubmit"] = [
-                    {
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": f'node "{self.claude_hooks_dir}/core/mid-conversation.js"',
-                                "timeout": 8
-                            }
-                        ]
-                    }
-                ]
-
             # Handle existing settings with intelligent merging
             final_config = hook_config
-            if settings_file.exists():
+            if _exists(str(settings_file)):
                 # Backup existing settings
                 backup_settings = settings_file.with_suffix('.json.backup')
-                shutil.copy2(settings_file, backup_settings)
+                _fast_copy(settings_file, backup_settings)
                 self.info("Existing settings.json backed up")
 
                 try:
                     # Load existing settings
-                    with open(settings_file, 'r') as f:
-                        existing_settings = json.load(f)
+                    existing_settings = _load_json_file(settings_file)
 
                     # Intelligent merging: preserve existing hooks while adding/updating memory awareness hooks
                     if 'hooks' not in existing_settings:
@@ -430,18 +676,13 @@ class HookInstaller:
                     for hook_type in memory_hook_types:
                         if hook_type in existing_settings['hooks'] and hook_type in hook_config['hooks']:
                             # Check if existing hook is different from our memory awareness hook
-                            existing_commands = [
+                            existing_commands = {
                                 hook.get('command', '') for hooks_group in existing_settings['hooks'][hook_type]
                                 for hook in hooks_group.get('hooks', [])
-                            ]
-                            memory_commands = [
-                                hook.get('command', '') for hooks_group in hook_config['hooks'][hook_type]
-                                for hook in hooks_group.get('hooks', [])
-                            ]
+                            }
 
                             # Check if any existing command contains memory hook
-                            is_memory_hook = any('session-start.js' in cmd or 'session-end.js' in cmd or 'mid-conversation.js' in cmd
-                                               for cmd in existing_commands)
+                            is_memory_hook = any(MEMORY_HOOK_PATTERN.search(cmd) for cmd in existing_commands)
 
                             if not is_memory_hook:
                                 conflicts.append(hook_type)
@@ -472,8 +713,8 @@ class HookInstaller:
                     final_config = hook_config
 
             # Write final configuration
-            with open(settings_file, 'w') as f:
-                json.dump(final_config, f, indent=2)
+            _write_json_file(settings_file, final_config)
+            _exists.cache_clear()
 
             self.success("Claude Code settings configured successfully")
             return True
@@ -484,6 +725,8 @@ class HookInstaller:
 
     def run_tests(self, test_natural_triggers: bool = False) -> bool:
         """Run hook tests to verify installation."""
+        import subprocess
+
         self.info("Running installation tests...")
 
         success = True
@@ -506,10 +749,19 @@ class HookInstaller:
                 "utilities/mcp-client.js"
             ])
 
-        missing_files = []
-        for file in required_files:
-            if not (self.claude_hooks_dir / file).exists():
-                missing_files.append(file)
+        # List each directory once instead of stat'ing every required file
+        present_by_dir = {}
+        for subdir in {Path(file).parent for file in required_files}:
+            try:
+                with os.scandir(self.claude_hooks_dir / subdir) as it:
+                    present_by_dir[subdir] = {entry.name for entry in it}
+            except OSError:
+                present_by_dir[subdir] = set()
+
+        missing_files = [
+            file for file in required_files
+            if Path(file).name not in present_by_dir[Path(file).parent]
+        ]
 
         if missing_files:
             self.error("Installation incomplete - missing files:")
@@ -519,9 +771,14 @@ class HookInstaller:
         else:
             self.success("All required files installed correctly")
 
+        # Reuse the prerequisite probe rather than spawning node just to fail
+        if self.node_available is False:
+            self.warn("Node.js not available - skipping JavaScript validation and tests")
+            return success
+
         # Test Node.js execution
         test_script = self.claude_hooks_dir / "core" / "session-start.js"
-        if test_script.exists():
+        if _exists(str(test_script)):
             try:
                 result = subprocess.run(['node', '--check', str(test_script)],
                                       capture_output=True, text=True, timeout=10)
@@ -535,7 +792,7 @@ class HookInstaller:
 
         # Run integration tests if available
         integration_test = self.claude_hooks_dir / "tests" / "integration-test.js"
-        if integration_test.exists():
+        if _exists(str(integration_test)):
             try:
                 self.info("Running integration tests...")
                 result = subprocess.run(['node', str(integration_test)],
@@ -553,7 +810,7 @@ class HookInstaller:
         # Run Natural Memory Triggers tests if applicable
         if test_natural_triggers:
             natural_test = self.claude_hooks_dir / "test-natural-triggers.js"
-            if natural_test.exists():
+            if _exists(str(natural_test)):
                 try:
                     self.info("Running Natural Memory Triggers tests...")
                     result = subprocess.run(['node', str(natural_test)],
@@ -579,37 +836,37 @@ class HookInstaller:
             ]
 
             for directory in directories_to_check:
-                if directory.exists() and directory.is_dir():
+                st = _stat_or_none(directory)
+                if st is not None and stat.S_ISDIR(st.st_mode):
                     try:
                         # Check if directory is empty (no files, only empty subdirectories allowed)
-                        items = list(directory.iterdir())
-                        if not items:
+                        with os.scandir(directory) as it:
+                            entries = list(it)
+                        if not entries:
                             # Directory is completely empty
-                            directory.rmdir()
+                            os.rmdir(directory)
                             self.info(f"Removed empty directory: {directory.name}/")
                         else:
                             # Check if it only contains empty subdirectories
-                            all_empty = True
-                            for item in items:
-                                if item.is_file():
-                                    all_empty = False
-                                    break
-                                elif item.is_dir() and list(item.iterdir()):
-                                    all_empty = False
-                                    break
+                            # (DirEntry type checks reuse the readdir result, no extra stat)
+                            all_empty = all(
+                                entry.is_dir(follow_symlinks=False) and _is_empty_dir(entry.path)
+                                for entry in entries
+                            )
 
                             if all_empty:
                                 # Remove empty subdirectories first
-                                for item in items:
-                                    if item.is_dir():
-                                        item.rmdir()
+                                for entry in entries:
+                                    os.rmdir(entry.path)
                                 # Then remove the parent directory
-                                directory.rmdir()
+                                os.rmdir(directory)
                                 self.info(f"Removed empty directory tree: {directory.name}/")
                     except OSError:
                         # Directory not empty or permission issue, skip silently
                         pass
 
+            _exists.cache_clear()
+
         except Exception as e:
             self.warn(f"Could not cleanup empty directories: {e}")
 
@@ -618,43 +875,30 @@ class HookInstaller:
         self.info("Uninstalling Claude Code memory awareness hooks...")
 
         try:
-            if not self.claude_hooks_dir.exists():
+            if not _exists(str(self.claude_hooks_dir)):
                 self.info("No hooks installation found")
                 return True
 
-            # Remove hook files
-            files_to_remove = [
-                "core/session-start.js",
-                "core/session-end.js",
-                "core/mid-conversation.js",
-                "core/memory-retrieval.js",
-                "core/topic-change.js",
-                "memory-mode-controller.js",
-                "test-natural-triggers.js",
-                "test-mcp-hook.js",
-                "debug-pattern-test.js"
-            ]
-
-            # Remove utilities
-            utility_files = [
-                "utilities/adaptive-pattern-detector.js",
-                "utilities/performance-manager.js",
-                "utilities/mcp-client.js",
-                "utilities/memory-client.js",
-                "utilities/tiered-conversation-monitor.js"
-            ]
-            files_to_remove.extend(utility_files)
-
+            # Remove hook files with one directory scan per location
             removed_count = 0
-            for file in files_to_remove:
-                file_path = self.claude_hooks_dir / file
-                if file_path.exists():
-                    file_path.unlink()
-                    removed_count += 1
+            for subdir, names in UNINSTALL_FILES.items():
+                try:
+                    with os.scandir(self.claude_hooks_dir / subdir) as it:
+                        targets = [entry.path for entry in it if entry.name in names]
+                except FileNotFoundError:
+                    continue
+
+                for path in targets:
+                    try:
+                        os.unlink(path)
+                        removed_count += 1
+                    except FileNotFoundError:
+                        pass
+            _exists.cache_clear()
 
             # Remove config files if user confirms
             config_file = self.claude_hooks_dir / "config.json"
-            if config_file.exists():
+            if _exists(str(config_file)):
                 # We'll keep config files by default since they may have user customizations
                 self.info("Configuration files preserved (contains user customizations)")
 
@@ -732,11 +976,6 @@ Features:
             sys.exit(1)
         return
 
-    # Check prerequisites
-    if not installer.check_prerequisites() and not args.force:
-        installer.error("Prerequisites check failed. Use --force to continue anyway.")
-        sys.exit(1)
-
     # Determine what to install
     install_all = not (args.basic or args.natural_triggers) or args.all
     install_basic = args.basic or install_all
@@ -747,20 +986,19 @@ Features:
     installer.info(f"  Natural Memory Triggers: {'Yes' if install_natural_triggers else 'No'}")
 
     if args.dry_run:
-        installer.info("DRY RUN - No changes will be made")
-        installer.info("Would install:")
-        if install_basic:
-            installer.info("  - Basic memory awareness hooks")
-            installer.info("  - Core utilities and configuration")
-        if install_natural_triggers:
-            installer.info("  - Natural Memory Triggers v7.1.3")
-            installer.info("  - Mid-conversation hooks")
-            installer.info("  - Performance optimization utilities")
-            installer.info("  - CLI management tools")
+        sys.stdout.write(DRY_RUN_HEADER
+                         + (DRY_RUN_BASIC if install_basic else "")
+                         + (DRY_RUN_NATURAL_TRIGGERS if install_natural_triggers else ""))
         return
 
-    # Create backup
-    installer.create_backup()
+    # Check prerequisites (skipped in dry-run mode, which never consumes them)
+    if not installer.check_prerequisites() and not args.force:
+        installer.error("Prerequisites check failed. Use --force to continue anyway.")
+        sys.exit(1)
+
+    # Create backup only when something is actually going to be installed
+    if install_basic or install_natural_triggers:
+        installer.create_backup()
 
     # Perform installation
     overall_success = True
@@ -790,15 +1028,7 @@ Features:
 
             if install_basic and install_natural_triggers:
                 installer.success("Complete Claude Code memory awareness system installed")
-                installer.info("Features available:")
-                installer.info("  ✅ Session-start and session-end hooks")
-                installer.info("  ✅ Natural Memory Triggers with intelligent pattern detection")
-                installer.info("  ✅ Mid-conversation memory injection")
-                installer.info("  ✅ Performance optimization and CLI management")
-                installer.info("")
-                installer.info("CLI Management:")
-                installer.info(f"  node {installer.claude_hooks_dir}/memory-mode-controller.js status")
-                installer.info(f"  node {installer.claude_hooks_dir}/memory-mode-controller.js profile balanced")
+                sys.stdout.write(BASIC_AND_NT_BANNER.format(hooks_dir=installer.claude_hooks_dir))
             elif install_natural_triggers:
                 installer.success("Natural Memory Triggers v7.1.3 installed")
                 installer.info("Advanced memory awareness features available")
@@ -818,8 +1048,8 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Installation cancelled by user{Colors.NC}")
+        sys.stderr.write(Colors.CANCELLED_MSG)
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Colors.RED}Unexpected error: {e}{Colors.NC}")
+        sys.stderr.write(f"{Colors.ERROR_PREFIX}{e}{Colors.ERROR_SUFFIX}")
         sys.exit(1)
\ No newline at end of file
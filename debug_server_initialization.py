@@ -2,75 +2,133 @@
 """Enhanced diagnostic script to debug server initialization and Cloudflare backend issues"""
 
 import asyncio
+import json
 import os
 import sys
 import traceback
+from contextvars import ContextVar
 from pathlib import Path
 import logging
 
-# Setup logging to see detailed information
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson not available, fall back to stdlib json
+    _json_loads = json.loads
+
+# Fixed prefix the server puts in front of the health check JSON payload
+_HEALTH_PREFIX = "Database Health Check Results:\n"
+
+# Setup logging to see detailed information (raise LOG_LEVEL to quiet it, e.g. in CI)
+log_level = os.getenv('LOG_LEVEL', 'DEBUG').upper()
+logging.basicConfig(level=getattr(logging, log_level, logging.DEBUG),
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# HTTP client chatter from the Cloudflare calls drowns out the diagnostics
+for noisy_logger in ("urllib3", "httpx", "httpcore"):
+    logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
 # Setup path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 os.chdir(Path(__file__).parent)
 
+# Diagnostic output is collected and written once per section instead of
+# paying a separate stdout write for every line. Concurrent diagnostics each
+# get their own buffer (via the context variable) so their lines never interleave.
+_output = []
+_task_output: ContextVar[list] = ContextVar("diagnostic_output")
+
+
+def out(line: str = "") -> None:
+    """Queue a line of diagnostic output."""
+    _task_output.get(_output).append(line)
+
+
+def out_traceback() -> None:
+    """Queue the current exception's traceback with the rest of the output."""
+    out(traceback.format_exc().rstrip())
+
+
+async def run_buffered(diagnostic) -> list:
+    """Run a diagnostic coroutine function and return its buffered output lines."""
+    lines = []
+    _task_output.set(lines)
+    await diagnostic()
+    return lines
+
+
+def flush_output() -> None:
+    """Write all queued output in a single call."""
+    if _output:
+        sys.stdout.write("\n".join(_output) + "\n")
+        sys.stdout.flush()
+        _output.clear()
+
+
 # Load environment
 try:
     from mcp_memory_service import env_loader
 except ImportError:
     # env_loader might not be available in newer versions
     pass
-from mcp_memory_service.config import STORAGE_BACKEND, CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID
-
-print("=" * 80)
-print("ENHANCED MCP MEMORY SERVICE CLOUDFLARE BACKEND DIAGNOSTIC")
-print("=" * 80)
-
-print(f"\n📋 Configuration Check:")
-print(f"  Storage Backend: {STORAGE_BACKEND}")
-print(f"  API Token: {'SET' if CLOUDFLARE_API_TOKEN else 'NOT SET'}")
-print(f"  Account ID: {'SET' if CLOUDFLARE_ACCOUNT_ID else 'NOT SET'}")
+from mcp_memory_service.config import (
+    STORAGE_BACKEND, CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID,
+    CLOUDFLARE_VECTORIZE_INDEX, CLOUDFLARE_D1_DATABASE_ID,
+    CLOUDFLARE_R2_BUCKET, CLOUDFLARE_EMBEDDING_MODEL,
+    CLOUDFLARE_LARGE_CONTENT_THRESHOLD, CLOUDFLARE_MAX_RETRIES,
+    CLOUDFLARE_BASE_DELAY
+)
+
+out("=" * 80)
+out("ENHANCED MCP MEMORY SERVICE CLOUDFLARE BACKEND DIAGNOSTIC")
+out("=" * 80)
+
+out(f"\n📋 Configuration Check:")
+out(f"  Storage Backend: {STORAGE_BACKEND}")
+out(f"  API Token: {'SET' if CLOUDFLARE_API_TOKEN else 'NOT SET'}")
+out(f"  Account ID: {'SET' if CLOUDFLARE_ACCOUNT_ID else 'NOT SET'}")
+flush_output()
 
 async def test_server_initialization():
     """Test the actual server initialization flow"""
-    print(f"\n🚀 Testing Server Initialization Flow:")
+    out(f"\n🚀 Testing Server Initialization Flow:")
 
     try:
         from mcp_memory_service.server import MemoryServer
 
-        print("  ✅ MemoryServer import successful")
+        out("  ✅ MemoryServer import successful")
         server = MemoryServer()
-        print("  ✅ MemoryServer instance created")
+        out("  ✅ MemoryServer instance created")
 
         # Test the eager initialization directly
-        print(f"\n⚡ Testing Eager Storage Initialization:")
+        out(f"\n⚡ Testing Eager Storage Initialization:")
 
         try:
             success = await server._initialize_storage_with_timeout()
-            print(f"  📊 Eager init result: {'SUCCESS' if success else 'FAILED'}")
+            out(f"  📊 Eager init result: {'SUCCESS' if success else 'FAILED'}")
 
             if success and hasattr(server, 'storage') and server.storage:
                 storage_type = server.storage.__class__.__name__
-                print(f"  📦 Storage type: {storage_type}")
+                out(f"  📦 Storage type: {storage_type}")
 
                 # Test storage initialization
                 if hasattr(server.storage, 'initialize'):
-                    print(f"  🔧 Testing storage.initialize()...")
+                    out(f"  🔧 Testing storage.initialize()...")
                     await server.storage.initialize()
-                    print(f"  ✅ Storage initialization complete")
+                    out(f"  ✅ Storage initialization complete")
 
             else:
-                print(f"  ❌ No storage object created or eager init failed")
+                out(f"  ❌ No storage object created or eager init failed")
 
         except Exception as eager_error:
-            print(f"  ❌ Eager initialization error: {str(eager_error)}")
-            print(f"  📝 Traceback:")
-            traceback.print_exc()
+            out(f"  ❌ Eager initialization error: {str(eager_error)}")
+            out(f"  📝 Traceback:")
+            out_traceback()
 
         # Test the lazy initialization path
-        print(f"\n🔄 Testing Lazy Storage Initialization:")
+        out(f"\n🔄 Testing Lazy Storage Initialization:")
 
         # Reset state to test lazy initialization
         server.storage = None
@@ -80,60 +138,56 @@ async def test_server_initialization():
             storage = await server._ensure_storage_initialized()
             if storage:
                 storage_type = storage.__class__.__name__
-                print(f"  ✅ Lazy init successful, storage type: {storage_type}")
+                out(f"  ✅ Lazy init successful, storage type: {storage_type}")
             else:
-                print(f"  ❌ Lazy init returned None")
+                out(f"  ❌ Lazy init returned None")
 
         except Exception as lazy_error:
-            print(f"  ❌ Lazy initialization error: {str(lazy_error)}")
-            print(f"  📝 Traceback:")
-            traceback.print_exc()
+            out(f"  ❌ Lazy initialization error: {str(lazy_error)}")
+            out(f"  📝 Traceback:")
+            out_traceback()
 
         # Test health check
-        print(f"\n🏥 Testing Health Check:")
+        out(f"\n🏥 Testing Health Check:")
 
         try:
             result = await server.handle_check_database_health({})
             health_text = result[0].text if result and len(result) > 0 else "No result"
-            print(f"  📊 Health check result:")
+            out(f"  📊 Health check result:")
             # Parse and pretty print the health check result
-            import json
+            if health_text.startswith(_HEALTH_PREFIX):
+                health_text = health_text[len(_HEALTH_PREFIX):]
             try:
-                health_data = json.loads(health_text.replace("Database Health Check Results:\n", ""))
+                health_data = _json_loads(health_text)
                 backend = health_data.get("statistics", {}).get("backend", "unknown")
                 status = health_data.get("validation", {}).get("status", "unknown")
-                print(f"    Backend: {backend}")
-                print(f"    Status: {status}")
+                out(f"    Backend: {backend}")
+                out(f"    Status: {status}")
                 if "error" in health_data.get("statistics", {}):
-                    print(f"    Error: {health_data['statistics']['error']}")
+                    out(f"    Error: {health_data['statistics']['error']}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Health check payload:\n%s", json.dumps(health_data, indent=2))
             except json.JSONDecodeError:
-                print(f"    Raw result: {health_text[:200]}...")
+                out(f"    Raw result: {health_text[:200]}...")
 
         except Exception as health_error:
-            print(f"  ❌ Health check error: {str(health_error)}")
-            print(f"  📝 Traceback:")
-            traceback.print_exc()
+            out(f"  ❌ Health check error: {str(health_error)}")
+            out(f"  📝 Traceback:")
+            out_traceback()
 
     except Exception as server_error:
-        print(f"❌ Server creation error: {str(server_error)}")
-        print(f"📝 Traceback:")
-        traceback.print_exc()
+        out(f"❌ Server creation error: {str(server_error)}")
+        out(f"📝 Traceback:")
+        out_traceback()
 
 async def test_cloudflare_storage_directly():
     """Test Cloudflare storage initialization directly"""
-    print(f"\n☁️  Testing Cloudflare Storage Directly:")
+    out(f"\n☁️  Testing Cloudflare Storage Directly:")
 
     try:
         from mcp_memory_service.storage.cloudflare import CloudflareStorage
-        from mcp_memory_service.config import (
-            CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID,
-            CLOUDFLARE_VECTORIZE_INDEX, CLOUDFLARE_D1_DATABASE_ID,
-            CLOUDFLARE_R2_BUCKET, CLOUDFLARE_EMBEDDING_MODEL,
-            CLOUDFLARE_LARGE_CONTENT_THRESHOLD, CLOUDFLARE_MAX_RETRIES,
-            CLOUDFLARE_BASE_DELAY
-        )
 
-        print(f"  📋 Creating CloudflareStorage instance...")
+        out(f"  📋 Creating CloudflareStorage instance...")
         storage = CloudflareStorage(
             api_token=CLOUDFLARE_API_TOKEN,
             account_id=CLOUDFLARE_ACCOUNT_ID,
@@ -145,29 +199,39 @@ async def test_cloudflare_storage_directly():
             max_retries=CLOUDFLARE_MAX_RETRIES,
             base_delay=CLOUDFLARE_BASE_DELAY
         )
-        print(f"  ✅ CloudflareStorage instance created")
+        out(f"  ✅ CloudflareStorage instance created")
 
-        print(f"  🔧 Testing initialize() method...")
+        out(f"  🔧 Testing initialize() method...")
         await storage.initialize()
-        print(f"  ✅ CloudflareStorage.initialize() completed")
+        out(f"  ✅ CloudflareStorage.initialize() completed")
 
-        print(f"  📊 Testing get_stats() method...")
+        out(f"  📊 Testing get_stats() method...")
         stats = await storage.get_stats()
-        print(f"  ✅ Statistics retrieved: {stats}")
+        out(f"  ✅ Statistics retrieved: {stats}")
 
     except Exception as direct_error:
-        print(f"  ❌ Direct Cloudflare storage error: {str(direct_error)}")
-        print(f"  📝 Traceback:")
-        traceback.print_exc()
+        out(f"  ❌ Direct Cloudflare storage error: {str(direct_error)}")
+        out(f"  📝 Traceback:")
+        out_traceback()
 
 async def main():
     """Run all diagnostic tests"""
-    await test_cloudflare_storage_directly()
-    await test_server_initialization()
-
-    print(f"\n" + "=" * 80)
-    print("DIAGNOSTIC COMPLETE")
-    print("=" * 80)
+    # Both diagnostics are network-bound and independent, so run them
+    # concurrently and emit their output in a fixed order afterwards
+    diagnostics = (test_cloudflare_storage_directly, test_server_initialization)
+    results = await asyncio.gather(*(run_buffered(d) for d in diagnostics),
+                                   return_exceptions=True)
+    for diagnostic, result in zip(diagnostics, results):
+        if isinstance(result, BaseException):
+            out(f"\n❌ {diagnostic.__name__} crashed: {result}")
+        else:
+            _output.extend(result)
+    flush_output()
+
+    out(f"\n" + "=" * 80)
+    out("DIAGNOSTIC COMPLETE")
+    out("=" * 80)
+    flush_output()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
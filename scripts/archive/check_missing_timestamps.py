@@ -9,13 +9,74 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import asyncio
+import functools
 import json
+from contextlib import closing
 from typing import List, Dict, Any
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to stdlib json
+    orjson = None
 
 from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
 from mcp_memory_service.models.memory import Memory
 
+# Problematic memories printed in the console report
+MAX_PROBLEMATIC_SHOWN = 10
+# Problematic memories kept for the JSON report; the rest are only counted
+MAX_PROBLEMATIC_KEPT = 64
+
+CONTENT_PREVIEW_LENGTH = 100
+
+# SQL predicates classifying the stored created_at value
+NUMERIC_CREATED_AT_SQL = "typeof(created_at) IN ('real', 'integer')"
+INVALID_CREATED_AT_SQL = "typeof(created_at) NOT IN ('real', 'integer', 'null')"
+
+# Pragmas for the analyzer's own connections, which are opened with
+# mode=ro. A read-only connection cannot switch journal modes, so a
+# database the server keeps in WAL mode is simply read alongside it.
+READ_PRAGMAS = {
+    "busy_timeout": "5000",
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",  # Memory-map up to 256MB of the database file
+    "query_only": "1",  # Analysis never writes
+}
+
+# SQLite storage classes mapped to the Python type names they load as
+SQLITE_TYPE_NAMES = {'text': 'str', 'real': 'float', 'integer': 'int', 'blob': 'bytes'}
+
+
+@functools.lru_cache(maxsize=1024)
+def to_datetime(timestamp: float) -> datetime:
+    """Convert a timestamp to a local datetime, caching repeated conversions."""
+    return datetime.fromtimestamp(timestamp)
+
+
+def _preview(content: str, length: int = CONTENT_PREVIEW_LENGTH) -> str:
+    """Truncate content for display, marking truncation with an ellipsis."""
+    return content[:length] + "..." if len(content) > length else content
+
+
+def _problematic_entry(row) -> Dict[str, Any]:
+    """Build a report entry from a row of the problematic-memory query."""
+    content_hash, content, tags, memory_type, created_at, missing_both = row
+    entry = {
+        "content_hash": content_hash,
+        "content_preview": _preview(content or ''),
+    }
+    if missing_both:
+        # Tags are stored comma-separated; report them as a list like the storage does
+        tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else []
+        entry.update(tags=tag_list, memory_type=memory_type, issue="missing_both_timestamps")
+    else:
+        entry.update(created_at=str(created_at), issue="invalid_timestamp")
+    return entry
+
+
 class TimestampAnalyzer:
     """Analyze memory database for missing timestamp entries."""
 
@@ -25,7 +86,7 @@ class TimestampAnalyzer:
         self.storage = None
 
     async def setup(self):
-        """Initialize storage backend."""
+        """Check the database file exists before analyzing it."""
         print(f"=== Analyzing {self.storage_backend} database for timestamp issues ===")
         print(f"Database path: {self.db_path}")
 
@@ -45,6 +106,14 @@ class TimestampAnalyzer:
                     print(f"  ❌ Not found: {path}")
             return False
 
+        return True
+
+    async def setup_storage(self):
+        """Initialize the storage backend for the search-based fallback.
+
+        Storage initialization creates any missing tables and indexes, so it
+        only runs when the read-only direct query cannot be used.
+        """
         try:
             self.storage = SqliteVecMemoryStorage(
                 db_path=self.db_path,
@@ -57,86 +126,21 @@ class TimestampAnalyzer:
             print(f"❌ Failed to initialize storage: {e}")
             return False
 
-    async def get_all_memories(self) -> List[Memory]:
-        """Retrieve all memories from the database."""
-        try:
-            # SQLite-Vec has a limit of 4096 for k in knn queries, so use direct database access
-            return await self.get_memories_direct_query()
-        except Exception as e:
-            print(f"❌ Error with direct query, trying search approach: {e}")
-            return await self.get_memories_via_search()
-
-    async def get_memories_direct_query(self) -> List[Memory]:
-        """Get all memories using direct database queries."""
+    def _connect_for_read(self):
+        """Open a read-only connection to the database tuned for analysis."""
         import sqlite3
-        memories = []
-
-        try:
-            # Connect directly to SQLite database
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-
-            # Get all memory records
-            cursor = conn.execute("""
-                SELECT id, content, content_hash, tags, memory_type,
-                       created_at, created_at_iso, updated_at, updated_at_iso, metadata
-                FROM memories
-                ORDER BY created_at DESC
-            """)
-
-            rows = cursor.fetchall()
-            print(f"📊 Found {len(rows)} memory records in database")
-
-            for i, row in enumerate(rows):
-                try:
-                    # Safely parse JSON fields
-                    tags = []
-                    if row['tags']:
-                        try:
-                            tags = json.loads(row['tags'])
-                        except (json.JSONDecodeError, TypeError):
-                            tags = []
-
-                    metadata = {}
-                    if row['metadata']:
-                        try:
-                            metadata = json.loads(row['metadata'])
-                        except (json.JSONDecodeError, TypeError):
-                            metadata = {}
-
-                    # Reconstruct Memory object from database row
-                    memory_dict = {
-                        'content': row['content'] or '',
-                        'content_hash': row['content_hash'] or '',
-                        'tags': tags,
-                        'memory_type': row['memory_type'] or 'unknown',
-                        'created_at': row['created_at'],
-                        'created_at_iso': row['created_at_iso'],
-                        'updated_at': row['updated_at'],
-                        'updated_at_iso': row['updated_at_iso'],
-                        'metadata': metadata
-                    }
-
-                    memory = Memory.from_dict(memory_dict)
-                    memories.append(memory)
 
-                except Exception as e:
-                    print(f"⚠️  Error processing memory {i+1}: {e}")
-                    # Continue processing other memories
-                    continue
-
-            conn.close()
-            return memories
-
-        except Exception as e:
-            print(f"❌ Direct query failed: {e}")
-            if 'conn' in locals():
-                conn.close()
-            return []
+        # mode=ro makes SQLite reject any write, not just this script's own
+        conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True)
+        for pragma_name, pragma_value in READ_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma_name}={pragma_value}")
+        return conn
 
     async def get_memories_via_search(self) -> List[Memory]:
         """Get memories using search with smaller batches."""
         memories = []
+        # Hashes seen across all queries, kept so dedup never rescans memories
+        existing_hashes = set()
 
         try:
             # Try different search approaches with smaller limits
@@ -145,14 +149,18 @@ class TimestampAnalyzer:
             for query in search_queries:
                 try:
                     results = await self.storage.retrieve(query, n_results=1000)  # Well under 4096 limit
-                    batch_memories = [result.memory for result in results]
 
                     # Deduplicate based on content_hash
-                    existing_hashes = {m.content_hash for m in memories}
-                    new_memories = [m for m in batch_memories if m.content_hash not in existing_hashes]
-                    memories.extend(new_memories)
+                    new_count = 0
+                    for result in results:
+                        content_hash = result.memory.content_hash
+                        if content_hash in existing_hashes:
+                            continue
+                        existing_hashes.add(content_hash)
+                        memories.append(result.memory)
+                        new_count += 1
 
-                    print(f"📊 Query '{query}': {len(batch_memories)} results, {len(new_memories)} new")
+                    print(f"📊 Query '{query}': {len(results)} results, {new_count} new")
 
                 except Exception as e:
                     print(f"⚠️  Query '{query}' failed: {e}")
@@ -165,19 +173,80 @@ class TimestampAnalyzer:
             print(f"❌ All search approaches failed: {e}")
             return []
 
-    def analyze_timestamp_fields(self, memories: List[Memory]) -> Dict[str, Any]:
-        """Analyze timestamp fields across all memories."""
-        analysis = {
-            "total_memories": len(memories),
+    @staticmethod
+    def _new_analysis(total_memories: int = 0) -> Dict[str, Any]:
+        """Create an empty analysis accumulator."""
+        return {
+            "total_memories": total_memories,
             "missing_created_at": 0,
             "missing_created_at_iso": 0,
             "missing_both_timestamps": 0,
             "invalid_timestamps": 0,
+            "problematic_count": 0,
             "problematic_memories": [],
             "timestamp_formats": set(),
             "timestamp_range": {"earliest": None, "latest": None}
         }
 
+    @staticmethod
+    def _add_problematic(analysis: Dict[str, Any], entry: Dict[str, Any]):
+        """Count a problematic memory, keeping at most MAX_PROBLEMATIC_KEPT of them."""
+        analysis["problematic_count"] += 1
+        if len(analysis["problematic_memories"]) < MAX_PROBLEMATIC_KEPT:
+            analysis["problematic_memories"].append(entry)
+
+    def analyze_direct_query(self) -> Dict[str, Any]:
+        """Analyze timestamps with SQL aggregates instead of a Python loop over every row."""
+        with closing(self._connect_for_read()) as conn:
+            # Keep a larger page cache for the aggregate scan
+            conn.execute("PRAGMA cache_size=-65536")
+
+            (total, missing_created_at, missing_created_at_iso, missing_both,
+             invalid, earliest, latest) = conn.execute(f"""
+                SELECT COUNT(*),
+                       COALESCE(SUM(created_at IS NULL), 0),
+                       COALESCE(SUM(created_at_iso IS NULL), 0),
+                       COALESCE(SUM(created_at IS NULL AND created_at_iso IS NULL), 0),
+                       COALESCE(SUM({INVALID_CREATED_AT_SQL}), 0),
+                       MIN(CASE WHEN {NUMERIC_CREATED_AT_SQL} THEN created_at END),
+                       MAX(CASE WHEN {NUMERIC_CREATED_AT_SQL} THEN created_at END)
+                FROM memories
+            """).fetchone()
+            print(f"📊 Found {total} memory records in database")
+
+            analysis = self._new_analysis(total)
+            analysis["missing_created_at"] = missing_created_at
+            analysis["missing_created_at_iso"] = missing_created_at_iso
+            analysis["missing_both_timestamps"] = missing_both
+            analysis["invalid_timestamps"] = invalid
+            analysis["problematic_count"] = missing_both + invalid
+            analysis["timestamp_range"] = {"earliest": earliest, "latest": latest}
+
+            # Report storage classes using the Python type names the
+            # Memory-based analysis would produce
+            analysis["timestamp_formats"] = [
+                SQLITE_TYPE_NAMES.get(sqlite_type, sqlite_type)
+                for (sqlite_type,) in conn.execute(
+                    "SELECT DISTINCT typeof(created_at_iso) FROM memories WHERE created_at_iso IS NOT NULL"
+                )
+            ]
+
+            # Only the rows that will be kept are fetched
+            rows = conn.execute(f"""
+                SELECT content_hash, content, tags, memory_type, created_at,
+                       created_at IS NULL AND created_at_iso IS NULL
+                FROM memories
+                WHERE (created_at IS NULL AND created_at_iso IS NULL) OR {INVALID_CREATED_AT_SQL}
+                LIMIT ?
+            """, (MAX_PROBLEMATIC_KEPT,))
+            analysis["problematic_memories"] = [_problematic_entry(row) for row in rows]
+
+            return analysis
+
+    def analyze_timestamp_fields(self, memories: List[Memory]) -> Dict[str, Any]:
+        """Analyze timestamp fields across all memories."""
+        analysis = self._new_analysis(len(memories))
+
         for memory in memories:
             has_created_at = memory.created_at is not None
             has_created_at_iso = memory.created_at_iso is not None
@@ -191,9 +260,9 @@ class TimestampAnalyzer:
 
             if not has_created_at and not has_created_at_iso:
                 analysis["missing_both_timestamps"] += 1
-                analysis["problematic_memories"].append({
+                self._add_problematic(analysis, {
                     "content_hash": memory.content_hash,
-                    "content_preview": memory.content[:100] + "..." if len(memory.content) > 100 else memory.content,
+                    "content_preview": _preview(memory.content),
                     "tags": memory.tags,
                     "memory_type": memory.memory_type,
                     "issue": "missing_both_timestamps"
@@ -211,9 +280,9 @@ class TimestampAnalyzer:
                         analysis["timestamp_range"]["latest"] = memory.created_at
                 except:
                     analysis["invalid_timestamps"] += 1
-                    analysis["problematic_memories"].append({
+                    self._add_problematic(analysis, {
                         "content_hash": memory.content_hash,
-                        "content_preview": memory.content[:100] + "..." if len(memory.content) > 100 else memory.content,
+                        "content_preview": _preview(memory.content),
                         "created_at": str(memory.created_at),
                         "issue": "invalid_timestamp"
                     })
@@ -247,8 +316,8 @@ class TimestampAnalyzer:
 
         print(f"\n🕐 TIMESTAMP RANGE:")
         if analysis["timestamp_range"]["earliest"] and analysis["timestamp_range"]["latest"]:
-            earliest = datetime.fromtimestamp(analysis["timestamp_range"]["earliest"])
-            latest = datetime.fromtimestamp(analysis["timestamp_range"]["latest"])
+            earliest = to_datetime(analysis["timestamp_range"]["earliest"])
+            latest = to_datetime(analysis["timestamp_range"]["latest"])
             print(f"  Earliest: {earliest} ({analysis['timestamp_range']['earliest']})")
             print(f"  Latest: {latest} ({analysis['timestamp_range']['latest']})")
         else:
@@ -259,8 +328,9 @@ class TimestampAnalyzer:
             print(f"  - {fmt}")
 
         if analysis["problematic_memories"]:
-            print(f"\n⚠️  PROBLEMATIC MEMORIES ({len(analysis['problematic_memories'])}):")
-            for i, memory in enumerate(analysis["problematic_memories"][:10]):  # Show first 10
+            print(f"\n⚠️  PROBLEMATIC MEMORIES ({analysis['problematic_count']}):")
+            shown = analysis["problematic_memories"][:MAX_PROBLEMATIC_SHOWN]
+            for i, memory in enumerate(shown):
                 print(f"  {i+1}. Issue: {memory['issue']}")
                 print(f"     Content: {memory['content_preview']}")
                 print(f"     Hash: {memory['content_hash']}")
@@ -268,8 +338,8 @@ class TimestampAnalyzer:
                     print(f"     Tags: {memory.get('tags', [])}")
                 print()
 
-            if len(analysis["problematic_memories"]) > 10:
-                print(f"  ... and {len(analysis['problematic_memories']) - 10} more")
+            if analysis["problematic_count"] > len(shown):
+                print(f"  ... and {analysis['problematic_count'] - len(shown)} more")
 
         # Health assessment
         print(f"\n🏥 DATABASE HEALTH ASSESSMENT:")
@@ -290,25 +360,39 @@ class TimestampAnalyzer:
         if not await self.setup():
             return False
 
-        memories = await self.get_all_memories()
-        if not memories:
+        try:
+            analysis = self.analyze_direct_query()
+        except Exception as e:
+            print(f"❌ Error with direct query, trying search approach: {e}")
+            if not await self.setup_storage():
+                return False
+            analysis = self.analyze_timestamp_fields(await self.get_memories_via_search())
+
+        if not analysis["total_memories"]:
             print("⚠️  No memories found in database")
             return False
 
-        analysis = self.analyze_timestamp_fields(memories)
         self.print_analysis_report(analysis)
 
         # Save detailed report to file
         report_file = "timestamp_analysis_report.json"
-        with open(report_file, 'w') as f:
-            # Convert any datetime objects to strings for JSON serialization
-            json_analysis = analysis.copy()
-            if json_analysis["timestamp_range"]["earliest"]:
-                json_analysis["timestamp_range"]["earliest_iso"] = datetime.fromtimestamp(json_analysis["timestamp_range"]["earliest"]).isoformat()
-            if json_analysis["timestamp_range"]["latest"]:
-                json_analysis["timestamp_range"]["latest_iso"] = datetime.fromtimestamp(json_analysis["timestamp_range"]["latest"]).isoformat()
-
-            json.dump(json_analysis, f, indent=2, default=str)
+
+        # Add ISO renderings of the range; everything else in the analysis is
+        # already a JSON-native type, so no default= hook is needed
+        json_analysis = analysis.copy()
+        if json_analysis["timestamp_range"]["earliest"]:
+            json_analysis["timestamp_range"]["earliest_iso"] = to_datetime(json_analysis["timestamp_range"]["earliest"]).isoformat()
+        if json_analysis["timestamp_range"]["latest"]:
+            json_analysis["timestamp_range"]["latest_iso"] = to_datetime(json_analysis["timestamp_range"]["latest"]).isoformat()
+
+        if orjson is not None:
+            report = orjson.dumps(json_analysis, option=orjson.OPT_INDENT_2)
+        else:
+            report = json.dumps(json_analysis, indent=2).encode('utf-8')
+
+        # Write the whole report with a single call
+        with open(report_file, 'wb') as f:
+            f.write(report)
 
         print(f"\n📄 Detailed report saved to: {report_file}")
 
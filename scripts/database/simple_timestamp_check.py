@@ -11,6 +11,7 @@ import sqlite3
 import json
 import argparse
 import logging
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -22,14 +23,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pragmas for the read-only analysis connection: memory-map the file and keep
+# a large page cache so each query reuses pages the previous one loaded
+READ_PRAGMAS = {
+    'query_only': '1',
+    'mmap_size': '268435456',  # 256MB
+    'cache_size': '-65536',  # 64MB
+    'temp_store': 'MEMORY',
+}
 
-def analyze_timestamps(db_path: str, output_format: str = 'text', verbose: bool = False) -> Dict[str, Any]:
+# Upper bound on partial-timestamp examples, whatever the sample size
+PARTIAL_SAMPLE_LIMIT = 5
+
+
+def analyze_timestamps(db_path: str, output_format: str = 'text', verbose: bool = False,
+                       sample_size: int = 10) -> Dict[str, Any]:
     """Analyze timestamp fields directly in the database.
 
     Args:
         db_path: Path to the SQLite database file
         output_format: Output format ('text', 'json', or 'summary')
         verbose: Enable verbose output
+        sample_size: Maximum number of example rows fetched per problem category
+            (partial-timestamp examples are capped at PARTIAL_SAMPLE_LIMIT)
 
     Returns:
         Dictionary containing analysis results
@@ -47,159 +63,156 @@ def analyze_timestamps(db_path: str, output_format: str = 'text', verbose: bool
         return {'error': error_msg, 'success': False}
 
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-
-        # Get basic stats
-        cursor = conn.execute("SELECT COUNT(*) as total FROM memories")
-        total_count = cursor.fetchone()['total']
-        results['total_memories'] = total_count
-
-        if output_format == 'text':
-            print(f"📊 Total memories in database: {total_count}")
-
-        # Analyze timestamp fields
-        cursor = conn.execute("""
-            SELECT
-                COUNT(*) as total,
-                COUNT(created_at) as has_created_at,
-                COUNT(created_at_iso) as has_created_at_iso,
-                COUNT(CASE WHEN created_at IS NULL AND created_at_iso IS NULL THEN 1 END) as missing_both,
-                MIN(created_at) as earliest_ts,
-                MAX(created_at) as latest_ts
-            FROM memories
-        """)
-
-        stats = cursor.fetchone()
-
-        # Store results
-        results['timestamp_stats'] = {
-            'total': stats['total'],
-            'has_created_at': stats['has_created_at'],
-            'has_created_at_iso': stats['has_created_at_iso'],
-            'missing_both': stats['missing_both'],
-            'missing_created_at': stats['total'] - stats['has_created_at'],
-            'missing_created_at_iso': stats['total'] - stats['has_created_at_iso']
-        }
-
-        if output_format == 'text':
-            print(f"\n🕐 TIMESTAMP ANALYSIS:")
-            print(f"  Total entries: {stats['total']}")
-            print(f"  Has created_at (float): {stats['has_created_at']}")
-            print(f"  Has created_at_iso (ISO): {stats['has_created_at_iso']}")
-            print(f"  Missing both timestamps: {stats['missing_both']}")
-
-        if output_format == 'text':
-            if stats['has_created_at'] > 0:
-                missing_created_at = stats['total'] - stats['has_created_at']
-                print(f"  Missing created_at: {missing_created_at}")
-
-            if stats['has_created_at_iso'] > 0:
-                missing_created_at_iso = stats['total'] - stats['has_created_at_iso']
-                print(f"  Missing created_at_iso: {missing_created_at_iso}")
-
-        # Show timestamp range
-        if stats['earliest_ts'] and stats['latest_ts']:
-            earliest = datetime.fromtimestamp(stats['earliest_ts'])
-            latest = datetime.fromtimestamp(stats['latest_ts'])
-            results['timestamp_range'] = {
-                'earliest': earliest.isoformat(),
-                'latest': latest.isoformat(),
-                'earliest_float': stats['earliest_ts'],
-                'latest_float': stats['latest_ts']
+        # Open read-only so the analysis never takes a write lock; the script
+        # only reads, so autocommit mode skips the module's transaction handling
+        with closing(sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True,
+                                     isolation_level=None, cached_statements=256)) as conn:
+            for pragma_name, pragma_value in READ_PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma_name}={pragma_value}")
+
+            # Gather every count and the timestamp range in a single table scan
+            cursor = conn.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COUNT(created_at) as has_created_at,
+                    COUNT(created_at_iso) as has_created_at_iso,
+                    COUNT(CASE WHEN created_at IS NULL AND created_at_iso IS NULL THEN 1 END) as missing_both,
+                    COUNT(CASE WHEN (created_at IS NULL) != (created_at_iso IS NULL) THEN 1 END) as partial,
+                    MIN(created_at) as earliest_ts,
+                    MAX(created_at) as latest_ts
+                FROM memories
+            """)
+
+            # Rows are plain tuples (no sqlite3.Row factory), unpacked positionally
+            (total, has_created_at, has_created_at_iso, missing_both,
+             partial_timestamps, earliest_ts, latest_ts) = cursor.fetchone()
+            results['total_memories'] = total
+
+            if output_format == 'text':
+                print(f"📊 Total memories in database: {total}")
+
+            # Store results
+            results['timestamp_stats'] = {
+                'total': total,
+                'has_created_at': has_created_at,
+                'has_created_at_iso': has_created_at_iso,
+                'missing_both': missing_both,
+                'missing_created_at': total - has_created_at,
+                'missing_created_at_iso': total - has_created_at_iso
             }
 
             if output_format == 'text':
-                print(f"\n📅 TIMESTAMP RANGE:")
-                print(f"  Earliest: {earliest} ({stats['earliest_ts']})")
-                print(f"  Latest: {latest} ({stats['latest_ts']})")
-
-        # Find problematic entries
-        cursor = conn.execute("""
-            SELECT id, content_hash, created_at, created_at_iso,
-                   SUBSTR(content, 1, 100) as content_preview
-            FROM memories
-            WHERE created_at IS NULL AND created_at_iso IS NULL
-            LIMIT 10
-        """)
-
-        problematic = cursor.fetchall()
-        results['missing_both_examples'] = len(problematic)
-
-        if output_format == 'text' and problematic:
-            print(f"\n⚠️  ENTRIES MISSING BOTH TIMESTAMPS ({len(problematic)} shown):")
-            for row in problematic:
-                print(f"  ID {row['id']}: {row['content_preview']}...")
-                if verbose:
-                    print(f"    Hash: {row['content_hash']}")
-                    print(f"    created_at: {row['created_at']}")
-                    print(f"    created_at_iso: {row['created_at_iso']}")
-                    print()
-
-        # Find entries with only one timestamp type
-        cursor = conn.execute("""
-            SELECT COUNT(*) as count
-            FROM memories
-            WHERE (created_at IS NULL AND created_at_iso IS NOT NULL)
-               OR (created_at IS NOT NULL AND created_at_iso IS NULL)
-        """)
-
-        partial_timestamps = cursor.fetchone()['count']
-        results['partial_timestamps'] = partial_timestamps
-
-        if output_format == 'text' and partial_timestamps > 0:
-            print(f"\n⚠️  ENTRIES WITH PARTIAL TIMESTAMPS: {partial_timestamps}")
-
-            # Show some examples
+                print(f"\n🕐 TIMESTAMP ANALYSIS:")
+                print(f"  Total entries: {total}")
+                print(f"  Has created_at (float): {has_created_at}")
+                print(f"  Has created_at_iso (ISO): {has_created_at_iso}")
+                print(f"  Missing both timestamps: {missing_both}")
+
+            if output_format == 'text':
+                if has_created_at > 0:
+                    missing_created_at = total - has_created_at
+                    print(f"  Missing created_at: {missing_created_at}")
+
+                if has_created_at_iso > 0:
+                    missing_created_at_iso = total - has_created_at_iso
+                    print(f"  Missing created_at_iso: {missing_created_at_iso}")
+
+            # Show timestamp range
+            if earliest_ts and latest_ts:
+                earliest = datetime.fromtimestamp(earliest_ts)
+                latest = datetime.fromtimestamp(latest_ts)
+                results['timestamp_range'] = {
+                    'earliest': earliest.isoformat(),
+                    'latest': latest.isoformat(),
+                    'earliest_float': earliest_ts,
+                    'latest_float': latest_ts
+                }
+
+                if output_format == 'text':
+                    print(f"\n📅 TIMESTAMP RANGE:")
+                    print(f"  Earliest: {earliest} ({earliest_ts})")
+                    print(f"  Latest: {latest} ({latest_ts})")
+
+            # Find problematic entries
             cursor = conn.execute("""
                 SELECT id, content_hash, created_at, created_at_iso,
-                       SUBSTR(content, 1, 60) as content_preview
+                       SUBSTR(content, 1, 100) as content_preview
                 FROM memories
-                WHERE (created_at IS NULL AND created_at_iso IS NOT NULL)
-                   OR (created_at IS NOT NULL AND created_at_iso IS NULL)
-                LIMIT 5
-            """)
+                WHERE created_at IS NULL AND created_at_iso IS NULL
+                LIMIT ?
+            """, (sample_size,))
+
+            problematic = cursor.fetchmany(sample_size)
+            cursor.close()
+            results['missing_both_examples'] = len(problematic)
+
+            if output_format == 'text' and problematic:
+                print(f"\n⚠️  ENTRIES MISSING BOTH TIMESTAMPS ({len(problematic)} shown):")
+                for row_id, content_hash, created_at, created_at_iso, content_preview in problematic:
+                    print(f"  ID {row_id}: {content_preview}...")
+                    if verbose:
+                        print(f"    Hash: {content_hash}")
+                        print(f"    created_at: {created_at}")
+                        print(f"    created_at_iso: {created_at_iso}")
+                        print()
+
+            # Entries with only one timestamp type
+            results['partial_timestamps'] = partial_timestamps
+
+            if output_format == 'text' and partial_timestamps > 0:
+                print(f"\n⚠️  ENTRIES WITH PARTIAL TIMESTAMPS: {partial_timestamps}")
+
+                # Show some examples (predicate matches the storage's
+                # idx_partial_timestamps partial index)
+                partial_sample_size = min(sample_size, PARTIAL_SAMPLE_LIMIT)
+                cursor = conn.execute("""
+                    SELECT id, content_hash, created_at, created_at_iso,
+                           SUBSTR(content, 1, 60) as content_preview
+                    FROM memories
+                    WHERE (created_at IS NULL) != (created_at_iso IS NULL)
+                    LIMIT ?
+                """, (partial_sample_size,))
+
+                examples = cursor.fetchmany(partial_sample_size)
+                cursor.close()
+                if output_format == 'text' and verbose:
+                    for row_id, content_hash, created_at, created_at_iso, content_preview in examples:
+                        print(f"  ID {row_id}: {content_preview}...")
+                        print(f"    created_at: {created_at}")
+                        print(f"    created_at_iso: {created_at_iso}")
+                        print()
+
+            # Health assessment
+            health_status = 'EXCELLENT'
+            health_message = 'All memories have complete timestamps'
+
+            if missing_both > 0:
+                if missing_both < total * 0.01:
+                    health_status = 'GOOD'
+                    health_message = f"Only {missing_both}/{total} missing all timestamps"
+                elif missing_both < total * 0.1:
+                    health_status = 'WARNING'
+                    health_message = f"{missing_both}/{total} missing all timestamps"
+                else:
+                    health_status = 'CRITICAL'
+                    health_message = f"{missing_both}/{total} missing all timestamps"
+
+            results['health'] = {
+                'status': health_status,
+                'message': health_message,
+                'partial_timestamps': partial_timestamps
+            }
 
-            examples = cursor.fetchall()
-            if output_format == 'text' and verbose:
-                for row in examples:
-                    print(f"  ID {row['id']}: {row['content_preview']}...")
-                    print(f"    created_at: {row['created_at']}")
-                    print(f"    created_at_iso: {row['created_at_iso']}")
-                    print()
-
-        # Health assessment
-        health_status = 'EXCELLENT'
-        health_message = 'All memories have complete timestamps'
-
-        if stats['missing_both'] > 0:
-            if stats['missing_both'] < stats['total'] * 0.01:
-                health_status = 'GOOD'
-                health_message = f"Only {stats['missing_both']}/{stats['total']} missing all timestamps"
-            elif stats['missing_both'] < stats['total'] * 0.1:
-                health_status = 'WARNING'
-                health_message = f"{stats['missing_both']}/{stats['total']} missing all timestamps"
-            else:
-                health_status = 'CRITICAL'
-                health_message = f"{stats['missing_both']}/{stats['total']} missing all timestamps"
-
-        results['health'] = {
-            'status': health_status,
-            'message': health_message,
-            'partial_timestamps': partial_timestamps
-        }
-
-        if output_format == 'text':
-            print(f"\n🏥 DATABASE HEALTH:")
-            emoji = {'EXCELLENT': '✅', 'GOOD': '✅', 'WARNING': '⚠️', 'CRITICAL': '❌'}
-            print(f"  {emoji.get(health_status, '?')} {health_status}: {health_message}")
-
-            if partial_timestamps > 0:
-                print(f"  ⚠️  {partial_timestamps} entries have only partial timestamp data")
-            else:
-                print("  ✅ All entries with timestamps have both float and ISO formats")
+            if output_format == 'text':
+                print(f"\n🏥 DATABASE HEALTH:")
+                emoji = {'EXCELLENT': '✅', 'GOOD': '✅', 'WARNING': '⚠️', 'CRITICAL': '❌'}
+                print(f"  {emoji.get(health_status, '?')} {health_status}: {health_message}")
+
+                if partial_timestamps > 0:
+                    print(f"  ⚠️  {partial_timestamps} entries have only partial timestamp data")
+                else:
+                    print("  ✅ All entries with timestamps have both float and ISO formats")
 
-        conn.close()
         results['success'] = True
         return results
 
@@ -216,12 +229,23 @@ def analyze_timestamps(db_path: str, output_format: str = 'text', verbose: bool
         logger.error(error_msg)
         results['error'] = error_msg
         results['success'] = False
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
     return results
 
+def _exit_code(results: Dict[str, Any]) -> int:
+    """Map one database's analysis results to the script's exit code."""
+    if results.get('success'):
+        health_status = results.get('health', {}).get('status', 'UNKNOWN')
+        if health_status in ['EXCELLENT', 'GOOD']:
+            return 0
+        elif health_status == 'WARNING':
+            return 1
+        else:
+            return 2
+    else:
+        return 3
+
+
 def main():
     """Main entry point with CLI argument parsing."""
     # Set up argument parser
@@ -232,6 +256,7 @@ def main():
 Examples:
   %(prog)s                                    # Use default database path
   %(prog)s /path/to/database.db              # Analyze specific database
+  %(prog)s backups/*.db -f json              # Analyze several databases in one run
   %(prog)s -f json -o results.json           # Output JSON to file
   %(prog)s --verbose                         # Show detailed analysis
   %(prog)s --format summary                  # Quick health check only
@@ -243,9 +268,9 @@ Examples:
 
     parser.add_argument(
         'database',
-        nargs='?',
-        default=str(default_db_path),
-        help=f'Path to SQLite database (default: {default_db_path})'
+        nargs='*',
+        default=[str(default_db_path)],
+        help=f'Path(s) to SQLite database (default: {default_db_path})'
     )
 
     parser.add_argument(
@@ -266,6 +291,14 @@ Examples:
         help='Show verbose output with additional details'
     )
 
+    parser.add_argument(
+        '--sample-size',
+        type=int,
+        default=10,
+        metavar='N',
+        help='Number of example entries to fetch per problem category (default: 10; partial-timestamp examples are capped at 5)'
+    )
+
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -280,42 +313,48 @@ Examples:
     elif args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Analyze the database
-    results = analyze_timestamps(args.database, args.format, args.verbose)
+    # Analyze every database in this one process
+    all_results = [analyze_timestamps(db_path, args.format, args.verbose, args.sample_size)
+                   for db_path in args.database]
+    multiple = len(all_results) > 1
 
     # Handle output
     if args.format == 'json':
-        output = json.dumps(results, indent=2, default=str)
+        # A single database keeps the original object output; several
+        # databases produce an array of per-database results
+        if multiple:
+            document = [dict(result, database=db_path) for db_path, result in zip(args.database, all_results)]
+        else:
+            document = all_results[0]
+
+        # Serialize straight to the destination rather than building the
+        # whole document as a string first
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(output)
+                json.dump(document, f, indent=2, default=str)
+                f.write('\n')
             if not args.quiet:
                 print(f"Results written to {args.output}")
         else:
-            print(output)
+            json.dump(document, sys.stdout, indent=2, default=str)
+            sys.stdout.write('\n')
     elif args.format == 'summary':
-        if results.get('success'):
-            health = results.get('health', {})
-            print(f"Status: {health.get('status', 'UNKNOWN')}")
-            print(f"Message: {health.get('message', 'No health data')}")
-            print(f"Total Memories: {results.get('total_memories', 0)}")
-            missing = results.get('timestamp_stats', {}).get('missing_both', 0)
-            if missing > 0:
-                print(f"Missing Timestamps: {missing}")
-        else:
-            print(f"Error: {results.get('error', 'Unknown error')}")
+        for db_path, results in zip(args.database, all_results):
+            if multiple:
+                print(f"\n=== {db_path} ===")
+            if results.get('success'):
+                health = results.get('health', {})
+                print(f"Status: {health.get('status', 'UNKNOWN')}")
+                print(f"Message: {health.get('message', 'No health data')}")
+                print(f"Total Memories: {results.get('total_memories', 0)}")
+                missing = results.get('timestamp_stats', {}).get('missing_both', 0)
+                if missing > 0:
+                    print(f"Missing Timestamps: {missing}")
+            else:
+                print(f"Error: {results.get('error', 'Unknown error')}")
 
-    # Return appropriate exit code
-    if results.get('success'):
-        health_status = results.get('health', {}).get('status', 'UNKNOWN')
-        if health_status in ['EXCELLENT', 'GOOD']:
-            sys.exit(0)
-        elif health_status == 'WARNING':
-            sys.exit(1)
-        else:
-            sys.exit(2)
-    else:
-        sys.exit(3)
+    # Return the exit code of the least healthy database
+    sys.exit(max(_exit_code(results) for results in all_results))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -24,16 +24,19 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 new_script = os.path.join(script_dir, "server", "run_memory_server.py")
 
 if os.path.exists(new_script):
-    # Preserve the original __file__ context for the new script
-    global_vars = {
-        '__file__': new_script,
-        '__name__': '__main__',
-        'sys': sys,
-        'os': os
-    }
-
-    with open(new_script, 'r', encoding='utf-8') as f:
-        exec(compile(f.read(), new_script, 'exec'), global_vars)
+    if os.name == 'posix':
+        # Replace this process with the relocated script so only one
+        # interpreter stays resident. Interpreter options such as -u, -X
+        # and -W precede the script in sys.orig_argv and are passed on.
+        interpreter_options = sys.orig_argv[1:len(sys.orig_argv) - len(sys.argv)]
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, *interpreter_options, new_script, *sys.argv[1:]])
+    else:
+        # On Windows os.execv spawns a new process and exits this one, which
+        # breaks the stdio pipes MCP clients talk over; run it in-process
+        import runpy
+        sys.argv[0] = new_script
+        runpy.run_path(new_script, run_name='__main__')
 else:
     print(f"[ERROR] Could not find {new_script}", file=sys.stderr)
     print("[ERROR] Please ensure you have the complete mcp-memory-service repository", file=sys.stderr)
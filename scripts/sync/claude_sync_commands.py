@@ -25,40 +25,58 @@ from pathlib import Path
 SYNC_SCRIPT = Path(__file__).parent / "sync_memory_backends.py"
 
 def run_sync_command(args):
-    """Run the sync script with given arguments."""
-    cmd = [sys.executable, str(SYNC_SCRIPT)] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.stderr:
-        print(result.stderr.strip(), file=sys.stderr)
+    """Run the sync script with given arguments.
 
-    return result.returncode
+    The script is imported and run in-process to avoid paying interpreter
+    startup for every command; a subprocess is only used if it cannot be
+    imported here.
+    """
+    if str(SYNC_SCRIPT.parent) not in sys.path:
+        sys.path.insert(0, str(SYNC_SCRIPT.parent))
+    try:
+        from sync_memory_backends import main as sync_main
+    except ImportError:
+        return run_sync_subprocess(args)
 
-def memory_sync_status():
-    """Show memory sync status."""
-    return run_sync_command(['--status'])
+    old_argv = sys.argv
+    sys.argv = [str(SYNC_SCRIPT)] + args
+    try:
+        asyncio.run(sync_main())
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = old_argv
 
-def memory_sync_backup():
-    """Backup Cloudflare memories to SQLite-vec."""
-    print("Backing up Cloudflare memories to SQLite-vec...")
-    return run_sync_command(['--direction', 'cf-to-sqlite'])
+def run_sync_subprocess(args):
+    """Run the sync script in a separate interpreter.
 
-def memory_sync_restore():
-    """Restore SQLite-vec memories to Cloudflare."""
-    print("Restoring SQLite-vec memories to Cloudflare...")
-    return run_sync_command(['--direction', 'sqlite-to-cf'])
+    The child inherits our stdout/stderr so its progress shows up as it
+    happens instead of being buffered until exit.
+    """
+    cmd = [sys.executable, str(SYNC_SCRIPT)] + args
+    sys.stdout.flush()
+    return subprocess.run(cmd).returncode
 
-def memory_sync_bidirectional():
-    """Perform bidirectional sync."""
-    print("Performing bidirectional sync...")
-    return run_sync_command(['--direction', 'bidirectional'])
+# Sync script arguments for each command
+COMMANDS = {
+    "status": ['--status'],
+    "backup": ['--direction', 'cf-to-sqlite'],
+    "restore": ['--direction', 'sqlite-to-cf'],
+    "sync": ['--direction', 'bidirectional'],
+    "dry-run": ['--dry-run'],
+}
 
-def memory_sync_dry_run():
-    """Show what would be synced without making changes."""
-    print("Dry run - showing what would be synced:")
-    return run_sync_command(['--dry-run'])
+# Message printed before running a command, if any
+BANNERS = {
+    "backup": "Backing up Cloudflare memories to SQLite-vec...",
+    "restore": "Restoring SQLite-vec memories to Cloudflare...",
+    "sync": "Performing bidirectional sync...",
+    "dry-run": "Dry run - showing what would be synced:",
+}
 
 def show_usage():
     """Show usage information."""
@@ -71,23 +89,17 @@ def show_usage():
     print("  dry-run     - Show what would be synced")
 
 if __name__ == "__main__":
-    # Dictionary-based command dispatch for better scalability
-    commands = {
-        "status": memory_sync_status,
-        "backup": memory_sync_backup,
-        "restore": memory_sync_restore,
-        "sync": memory_sync_bidirectional,
-        "dry-run": memory_sync_dry_run,
-    }
-
     if len(sys.argv) < 2:
         show_usage()
         sys.exit(1)
 
     command = sys.argv[1]
 
-    if command in commands:
-        sys.exit(commands[command]())
+    if command in COMMANDS:
+        banner = BANNERS.get(command)
+        if banner:
+            print(banner)
+        sys.exit(run_sync_command(COMMANDS[command]))
     else:
         print(f"Unknown command: {command}")
         show_usage()
@@ -23,8 +23,10 @@ import asyncio
 import logging
 import argparse
 import hashlib
+import json
+import sqlite3
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Set, Optional, AsyncIterator
 from datetime import datetime
 
 # Add parent directory to path so we can import from the src directory
@@ -32,6 +34,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.mcp_memory_service.storage.cloudflare import CloudflareStorage
 from src.mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+from src.mcp_memory_service.storage.base import MemoryStorage
+from src.mcp_memory_service.models.memory import Memory
 from src.mcp_memory_service.config import (
     CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID, CLOUDFLARE_VECTORIZE_INDEX,
     CLOUDFLARE_D1_DATABASE_ID, BASE_DIR
@@ -44,12 +48,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger("memory_sync")
 
+# Memories fetched per request when streaming a backend
+SYNC_PAGE_SIZE = 500
+# Memories written to the target per store_batch call
+SYNC_BATCH_SIZE = 512
+
+# Extra pragmas for the sync's bulk writes into SQLite-vec. WAL and
+# synchronous=NORMAL are already the storage defaults; these give the bulk
+# load a larger page cache and fewer automatic checkpoints
+SYNC_PRAGMAS = {
+    'cache_size': '-131072',  # 128MB
+    'wal_autocheckpoint': '10000',
+}
+
+# Content hash sets kept between runs so steady-state syncs only fetch new rows
+HASH_CACHE_PATH = Path.home() / '.cache' / 'mcp_memory_sync' / 'content_hashes.json'
+
+
+class ContentHashCache:
+    """
+    Per-backend content hash sets persisted between sync runs.
+
+    Each entry records the highest row id it has seen, so the next run only
+    asks the backend for memories stored after it. Both backends use
+    AUTOINCREMENT ids, so nothing stored later can be missed. The merged set
+    can then only be too large, when memories were deleted. In that case its
+    size no longer matches the backend's count, and the entry is fetched again
+    in full.
+    """
+
+    def __init__(self, path: Path = HASH_CACHE_PATH):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path) as f:
+                self._entries = {
+                    key: {'last_id': int(entry['last_id']), 'hashes': set(entry['hashes'])}
+                    for key, entry in json.load(f).items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable hash cache {self.path}: {e}")
+
+    async def get(self, key: str, storage: MemoryStorage) -> Set[str]:
+        """Get a copy of a backend's content hashes, refreshing the cached entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            new_hashes, last_id = await storage.get_content_hashes_after_id(entry['last_id'])
+            if last_id is not None:
+                hashes = entry['hashes'] | new_hashes
+                if len(hashes) == await storage.count_all_memories():
+                    self._entries[key] = {'last_id': last_id, 'hashes': hashes}
+                    return set(hashes)
+            logger.info(f"Hash cache for {key} is stale, fetching all content hashes")
+
+        hashes, last_id = await storage.get_content_hashes_after_id()
+        if last_id is None:
+            # No row id to resume from, so nothing is cached for this backend
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = {'last_id': last_id, 'hashes': hashes}
+        return set(hashes)
+
+    def add(self, key: str, content_hash: str) -> None:
+        """Record a memory written to a backend during this run."""
+        if key in self._entries:
+            self._entries[key]['hashes'].add(content_hash)
+
+    def save(self) -> None:
+        """Write the cache back to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    key: {'last_id': entry['last_id'], 'hashes': list(entry['hashes'])}
+                    for key, entry in self._entries.items()
+                }, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save hash cache {self.path}: {e}")
+
+
 class MemorySync:
     """Handles bidirectional sync between Cloudflare and SQLite-vec backends."""
 
-    def __init__(self, sqlite_path: str = None):
+    def __init__(self, sqlite_path: str = None, hash_cache_path: Optional[Path] = HASH_CACHE_PATH):
         """Initialize sync with storage backends."""
         self.sqlite_path = sqlite_path or os.path.join(BASE_DIR, 'backup_sqlite_vec.db')
+        self._hash_cache = ContentHashCache(hash_cache_path) if hash_cache_path else None
 
         # Initialize storage backends
         self.cloudflare = CloudflareStorage(
@@ -61,44 +149,78 @@ class MemorySync:
 
         self.sqlite_vec = SqliteVecMemoryStorage(self.sqlite_path)
 
-    async def get_all_memories_from_backend(self, backend_name: str) -> List[Dict[str, Any]]:
-        """Get all memories from a specific backend."""
+    async def __aenter__(self) -> "MemorySync":
+        """Open the SQLite connection once for the lifetime of the sync."""
+        await self.sqlite_vec.initialize()
+        if self.sqlite_vec.conn is not None:
+            for pragma_name, pragma_value in SYNC_PRAGMAS.items():
+                self.sqlite_vec.conn.execute(f"PRAGMA {pragma_name}={pragma_value}")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the SQLite connection and the Cloudflare HTTP client."""
+        if self.sqlite_vec.conn is not None:
+            # Fold the bulk load's WAL back into the database before closing
+            try:
+                self.sqlite_vec.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint after sync failed: {e}")
+        self.sqlite_vec.close()
+        await self.cloudflare.close()
+        if self._hash_cache is not None:
+            self._hash_cache.save()
+
+    def _get_backend(self, backend_name: str) -> MemoryStorage:
+        """Get the storage instance for a backend name."""
         if backend_name == 'cloudflare':
-            backend = self.cloudflare
+            return self.cloudflare
         elif backend_name == 'sqlite_vec':
-            backend = self.sqlite_vec
+            return self.sqlite_vec
         else:
             raise ValueError(f"Unknown backend: {backend_name}")
 
-        try:
-            # Get all memories from the backend
-            memories_list = await backend.get_all_memories()
-
-            memories = []
-            for memory in memories_list:
-                memory_dict = {
-                    'id': memory.id,
-                    'content': memory.content,
-                    'metadata': memory.metadata,
-                    'timestamp': memory.timestamp,
-                    'hash': memory.hash
-                }
-                memories.append(memory_dict)
-
-            logger.info(f"Retrieved {len(memories)} memories from {backend_name}")
-            return memories
-
-        except Exception as e:
-            logger.error(f"Error retrieving memories from {backend_name}: {e}")
-            return []
+    def _hash_cache_key(self, backend_name: str) -> str:
+        """Identify a backend's database in the hash cache."""
+        if backend_name == 'cloudflare':
+            return f"cloudflare:{CLOUDFLARE_D1_DATABASE_ID}"
+        return f"{backend_name}:{os.path.abspath(self.sqlite_path)}"
+
+    async def get_content_hashes(self, backend_name: str) -> Set[str]:
+        """Get a backend's content hashes, through the hash cache when enabled."""
+        backend = self._get_backend(backend_name)
+        if self._hash_cache is None:
+            return await backend.get_all_content_hashes()
+        return await self._hash_cache.get(self._hash_cache_key(backend_name), backend)
+
+    async def iter_memories(self, backend_name: str, page_size: int = SYNC_PAGE_SIZE) -> AsyncIterator[Memory]:
+        """Yield all memories from a backend, fetching one page at a time."""
+        backend = self._get_backend(backend_name)
+
+        offset = 0
+        while True:
+            page = await backend.get_all_memories(limit=page_size, offset=offset)
+            for memory in page:
+                yield memory
+            if len(page) < page_size:
+                break
+            offset += page_size
 
     def calculate_content_hash(self, content: str, metadata: Dict[str, Any]) -> str:
         """Calculate a hash for memory content to detect duplicates."""
-        # Create a consistent string representation
-        content_str = f"{content}_{sorted(metadata.items())}"
-        return hashlib.sha256(content_str.encode()).hexdigest()[:16]
-
-    async def _sync_between_backends(self, source_backend: str, target_backend: str, dry_run: bool = False) -> Tuple[int, int]:
+        # Feed the pieces to the hasher in a consistent order instead of
+        # building one large string from the content and metadata
+        hasher = hashlib.sha256(content.encode())
+        hasher.update(b'_')
+        for key in sorted(metadata):
+            hasher.update(str(key).encode())
+            hasher.update(b'=')
+            hasher.update(str(metadata[key]).encode())
+            hasher.update(b';')
+        return hasher.hexdigest()[:16]
+
+    async def _sync_between_backends(self, source_backend: str, target_backend: str, dry_run: bool = False,
+                                     target_hashes: Optional[Set[str]] = None,
+                                     source_hashes: Optional[Set[str]] = None) -> Tuple[int, int]:
         """
         Generic method to sync memories between any two backends.
 
@@ -106,50 +228,88 @@ class MemorySync:
             source_backend: Backend to sync from ('cloudflare' or 'sqlite_vec')
             target_backend: Backend to sync to ('cloudflare' or 'sqlite_vec')
             dry_run: If True, only show what would be synced without making changes
+            target_hashes: Snapshot of the target's content hashes, fetched if not given
+            source_hashes: Snapshot of the source's content hashes, fetched if not given
 
         Returns:
             Tuple of (added_count, skipped_count)
         """
         logger.info(f"Starting sync from {source_backend} to {target_backend}...")
 
-        # Get memories from both backends
-        source_memories = await self.get_all_memories_from_backend(source_backend)
-        target_memories = await self.get_all_memories_from_backend(target_backend)
+        target_storage = self._get_backend(target_backend)
+        if source_hashes is None:
+            source_hashes = await self.get_content_hashes(source_backend)
+
+        # Stored content hashes are computed once at insert time and indexed,
+        # so they are the primary duplicate check and cost no hashing here.
+        # Only hashes are kept for the target; whole memories are never held in bulk
+        if target_storage is self.sqlite_vec:
+            # Let SQLite work out which source hashes it lacks, so the
+            # already-present majority never round-trips through Python
+            missing_hashes = await target_storage.get_missing_content_hashes(source_hashes)
+            target_hashes = source_hashes - missing_hashes
+        else:
+            if target_hashes is None:
+                target_hashes = await self.get_content_hashes(target_backend)
+            missing_hashes = source_hashes - target_hashes
 
-        # Create hash sets for quick lookup
-        target_hashes = {mem['hash'] for mem in target_memories if mem.get('hash')}
-        target_content_hashes = {
-            self.calculate_content_hash(mem['content'], mem['metadata'])
-            for mem in target_memories
-        }
+        # Nothing to copy, so the source never has to be scanned
+        if not missing_hashes:
+            logger.info(f"{source_backend} → {target_backend}: 0 added, {len(source_hashes)} skipped")
+            return 0, len(source_hashes)
 
         added_count = 0
         skipped_count = 0
-
-        # Get target backend instance for storing memories
-        target_storage = self.cloudflare if target_backend == 'cloudflare' else self.sqlite_vec
-
-        for source_memory in source_memories:
-            # Check if memory already exists (by hash or content)
-            content_hash = self.calculate_content_hash(source_memory['content'], source_memory['metadata'])
-
-            if (source_memory.get('hash') in target_hashes or
-                content_hash in target_content_hashes):
+        candidates = []
+
+        async def process_candidates():
+            nonlocal added_count, skipped_count
+            # Fall back to comparing content for memories whose stored hash was
+            # computed differently. Only the target memories sharing content
+            # with this batch are fetched, never the whole target.
+            matches = await target_storage.get_memories_by_content(memory.content for memory in candidates)
+            if matches:
+                # Content absent from the target cannot be a duplicate, so the
+                # SHA-256 is only computed for candidates whose content matched
+                matched_content = {memory.content for memory in matches}
+                duplicate_hashes = {self.calculate_content_hash(memory.content, memory.metadata) for memory in matches}
+                to_store = []
+                for memory in candidates:
+                    if (memory.content in matched_content and
+                            self.calculate_content_hash(memory.content, memory.metadata) in duplicate_hashes):
+                        skipped_count += 1
+                    else:
+                        to_store.append(memory)
+            else:
+                to_store = list(candidates)
+            candidates.clear()
+
+            if dry_run:
+                added_count += len(to_store)
+                return
+            if not to_store:
+                return
+            results = await target_storage.store_batch(to_store)
+            for memory, (success, message) in zip(to_store, results):
+                if success:
+                    added_count += 1
+                    if self._hash_cache is not None:
+                        self._hash_cache.add(self._hash_cache_key(target_backend), memory.content_hash)
+                    logger.debug(f"Added memory: {memory.content_hash[:8]}...")
+                else:
+                    logger.error(f"Error storing memory {memory.content_hash}: {message}")
+
+        async for source_memory in self.iter_memories(source_backend):
+            if source_memory.content_hash in target_hashes:
                 skipped_count += 1
                 continue
 
-            if not dry_run:
-                try:
-                    await target_storage.store_memory(
-                        content=source_memory['content'],
-                        metadata=source_memory['metadata']
-                    )
-                    added_count += 1
-                    logger.debug(f"Added memory: {source_memory['id'][:8]}...")
-                except Exception as e:
-                    logger.error(f"Error storing memory {source_memory['id']}: {e}")
-            else:
-                added_count += 1
+            candidates.append(source_memory)
+            if len(candidates) >= SYNC_BATCH_SIZE:
+                await process_candidates()
+
+        if candidates:
+            await process_candidates()
 
         logger.info(f"{source_backend} → {target_backend}: {added_count} added, {skipped_count} skipped")
         return added_count, skipped_count
@@ -166,27 +326,35 @@ class MemorySync:
         """Perform bidirectional sync between backends."""
         logger.info("Starting bidirectional sync...")
 
-        results = {}
-
-        # Sync Cloudflare → SQLite-vec
-        cf_to_sqlite = await self.sync_cloudflare_to_sqlite(dry_run)
-        results['cloudflare_to_sqlite'] = cf_to_sqlite
+        # Snapshot both hash sets before either direction writes, so memories
+        # copied by one direction are not copied straight back by the other.
+        # Each snapshot serves as one direction's source and the other's target
+        cf_hashes, sqlite_hashes = await asyncio.gather(
+            self.get_content_hashes('cloudflare'),
+            self.get_content_hashes('sqlite_vec')
+        )
 
-        # Sync SQLite-vec → Cloudflare
-        sqlite_to_cf = await self.sync_sqlite_to_cloudflare(dry_run)
-        results['sqlite_to_cloudflare'] = sqlite_to_cf
+        # The directions run one after the other: each pages through its
+        # source with LIMIT/OFFSET, and rows inserted into that backend by the
+        # other direction would shift the pages and yield memories twice
+        cf_to_sqlite = await self._sync_between_backends('cloudflare', 'sqlite_vec', dry_run,
+                                                         target_hashes=sqlite_hashes, source_hashes=cf_hashes)
+        sqlite_to_cf = await self._sync_between_backends('sqlite_vec', 'cloudflare', dry_run,
+                                                         target_hashes=cf_hashes, source_hashes=sqlite_hashes)
+
+        results = {
+            'cloudflare_to_sqlite': cf_to_sqlite,
+            'sqlite_to_cloudflare': sqlite_to_cf
+        }
 
         logger.info("Bidirectional sync completed")
         return results
 
     async def get_sync_status(self) -> Dict[str, Any]:
         """Get sync status showing memory counts in both backends."""
-        cf_memories = await self.get_all_memories_from_backend('cloudflare')
-        sqlite_memories = await self.get_all_memories_from_backend('sqlite_vec')
-
         status = {
-            'cloudflare_count': len(cf_memories),
-            'sqlite_vec_count': len(sqlite_memories),
+            'cloudflare_count': await self.cloudflare.count_all_memories(),
+            'sqlite_vec_count': await self.sqlite_vec.count_all_memories(),
             'sync_time': datetime.now().isoformat(),
             'backends_configured': {
                 'cloudflare': bool(CLOUDFLARE_API_TOKEN and CLOUDFLARE_ACCOUNT_ID),
@@ -204,6 +372,8 @@ async def main():
     parser.add_argument('--dry-run', action='store_true', help='Show what would be synced without actually syncing')
     parser.add_argument('--status', action='store_true', help='Show sync status only')
     parser.add_argument('--sqlite-path', help='Path to SQLite-vec database file')
+    parser.add_argument('--no-hash-cache', action='store_true',
+                        help=f'Fetch all content hashes instead of using the cache in {HASH_CACHE_PATH}')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
 
     args = parser.parse_args()
@@ -211,38 +381,38 @@ async def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Initialize sync
-    sync = MemorySync(sqlite_path=args.sqlite_path)
-
+    # Initialize sync; both backends keep one connection for the whole run
     try:
-        if args.status:
-            status = await sync.get_sync_status()
-            print(f"\n=== Memory Sync Status ===")
-            print(f"Cloudflare memories: {status['cloudflare_count']}")
-            print(f"SQLite-vec memories: {status['sqlite_vec_count']}")
-            print(f"Cloudflare configured: {status['backends_configured']['cloudflare']}")
-            print(f"SQLite-vec file exists: {status['backends_configured']['sqlite_vec']}")
-            print(f"Last check: {status['sync_time']}")
-            return
-
-        logger.info(f"=== Starting memory sync ({args.direction}) ===")
-        if args.dry_run:
-            logger.info("DRY RUN MODE - No changes will be made")
-
-        if args.direction == 'cf-to-sqlite':
-            added, skipped = await sync.sync_cloudflare_to_sqlite(dry_run=args.dry_run)
-            print(f"Cloudflare → SQLite-vec: {added} added, {skipped} skipped")
-        elif args.direction == 'sqlite-to-cf':
-            added, skipped = await sync.sync_sqlite_to_cloudflare(dry_run=args.dry_run)
-            print(f"SQLite-vec → Cloudflare: {added} added, {skipped} skipped")
-        else:  # bidirectional
-            results = await sync.bidirectional_sync(dry_run=args.dry_run)
-            cf_to_sqlite = results['cloudflare_to_sqlite']
-            sqlite_to_cf = results['sqlite_to_cloudflare']
-            print(f"Cloudflare → SQLite-vec: {cf_to_sqlite[0]} added, {cf_to_sqlite[1]} skipped")
-            print(f"SQLite-vec → Cloudflare: {sqlite_to_cf[0]} added, {sqlite_to_cf[1]} skipped")
-
-        logger.info("=== Sync completed successfully ===")
+        hash_cache_path = None if args.no_hash_cache else HASH_CACHE_PATH
+        async with MemorySync(sqlite_path=args.sqlite_path, hash_cache_path=hash_cache_path) as sync:
+            if args.status:
+                status = await sync.get_sync_status()
+                print(f"\n=== Memory Sync Status ===")
+                print(f"Cloudflare memories: {status['cloudflare_count']}")
+                print(f"SQLite-vec memories: {status['sqlite_vec_count']}")
+                print(f"Cloudflare configured: {status['backends_configured']['cloudflare']}")
+                print(f"SQLite-vec file exists: {status['backends_configured']['sqlite_vec']}")
+                print(f"Last check: {status['sync_time']}")
+                return
+
+            logger.info(f"=== Starting memory sync ({args.direction}) ===")
+            if args.dry_run:
+                logger.info("DRY RUN MODE - No changes will be made")
+
+            if args.direction == 'cf-to-sqlite':
+                added, skipped = await sync.sync_cloudflare_to_sqlite(dry_run=args.dry_run)
+                print(f"Cloudflare → SQLite-vec: {added} added, {skipped} skipped")
+            elif args.direction == 'sqlite-to-cf':
+                added, skipped = await sync.sync_sqlite_to_cloudflare(dry_run=args.dry_run)
+                print(f"SQLite-vec → Cloudflare: {added} added, {skipped} skipped")
+            else:  # bidirectional
+                results = await sync.bidirectional_sync(dry_run=args.dry_run)
+                cf_to_sqlite = results['cloudflare_to_sqlite']
+                sqlite_to_cf = results['sqlite_to_cloudflare']
+                print(f"Cloudflare → SQLite-vec: {cf_to_sqlite[0]} added, {cf_to_sqlite[1]} skipped")
+                print(f"SQLite-vec → Cloudflare: {sqlite_to_cf[0]} added, {sqlite_to_cf[1]} skipped")
+
+            logger.info("=== Sync completed successfully ===")
 
     except Exception as e:
         logger.error(f"Sync failed: {str(e)}")
@@ -4,15 +4,76 @@ Diagnostic script to troubleshoot backend configuration issues.
 This helps identify why Cloudflare backend might not be working.
 """
 
+import contextlib
+import functools
+import io
 import os
+import re
 import sys
 from pathlib import Path
+from typing import Optional
+
+# Repository root (this script lives in scripts/validation/)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ENV_FILE = PROJECT_ROOT / ".env"
 
 # Add src to path for imports
-src_path = Path(__file__).parent.parent.parent / "src"
+src_path = PROJECT_ROOT / "src"
 sys.path.insert(0, str(src_path))
 
+# .env assignments mentioning a token, password or secret; the value after
+# the first '=' is replaced so the whole file is masked in one substitution
+SENSITIVE_ASSIGNMENT_PATTERN = re.compile(r'^(?=.*(?:TOKEN|PASSWORD|SECRET))([^=\n]*)=.*$', re.MULTILINE)
+
+# Cloudflare settings, grouped by whether the backend needs them
+REQUIRED_CLOUDFLARE_VARS = (
+    'CLOUDFLARE_API_TOKEN',
+    'CLOUDFLARE_ACCOUNT_ID',
+    'CLOUDFLARE_VECTORIZE_INDEX',
+    'CLOUDFLARE_D1_DATABASE_ID',
+)
+OPTIONAL_CLOUDFLARE_VARS = (
+    'CLOUDFLARE_R2_BUCKET',
+    'CLOUDFLARE_EMBEDDING_MODEL',
+    'CLOUDFLARE_LARGE_CONTENT_THRESHOLD',
+    'CLOUDFLARE_MAX_RETRIES',
+    'CLOUDFLARE_BASE_DELAY',
+)
+# Settings whose values are only shown masked
+TOKEN_VARS = frozenset(('CLOUDFLARE_API_TOKEN',))
+
+def display_env_value(var, value):
+    """Format an environment value for output, masking tokens."""
+    return f"{value[:8]}***MASKED***" if var in TOKEN_VARS else value
+
+@functools.lru_cache(maxsize=1)
+def read_env_file(env_file: str) -> Optional[str]:
+    """Read the .env file once; every check shares the same text."""
+    try:
+        with open(env_file, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+class SectionBuffer(io.StringIO):
+    """Collect printed lines and pass them to the real stream in one write on flush."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def flush(self):
+        text = self.getvalue()
+        if text:
+            self._stream.write(text)
+            self.seek(0)
+            self.truncate()
+        self._stream.flush()
+
 def print_separator(title):
+    # Output is collected in a SectionBuffer (see main), so flushing here
+    # writes the previous section in one go
+    sys.stdout.flush()
     print("\n" + "=" * 60)
     print(f" {title}")
     print("=" * 60)
@@ -32,24 +93,18 @@ def check_env_file():
     """Check if .env file exists and what it contains."""
     print_separator("ENVIRONMENT FILE CHECK")
 
-    project_root = Path(__file__).parent.parent.parent
-    env_file = project_root / ".env"
+    env_file = ENV_FILE
 
-    if env_file.exists():
+    env_text = read_env_file(str(env_file))
+
+    if env_text is not None:
         print_status("success", f".env file found at: {env_file}")
         print("\n.env file contents:")
-        with open(env_file, 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines, 1):
-                # Mask sensitive values
-                if 'TOKEN' in line or 'PASSWORD' in line or 'SECRET' in line:
-                    if '=' in line:
-                        key, _ = line.split('=', 1)
-                        print(f"  {i:2d}: {key}=***MASKED***")
-                    else:
-                        print(f"  {i:2d}: {line.rstrip()}")
-                else:
-                    print(f"  {i:2d}: {line.rstrip()}")
+        # Mask sensitive values
+        masked_text = SENSITIVE_ASSIGNMENT_PATTERN.sub(r'\1=***MASKED***', env_text)
+        # Iterate the lines lazily rather than splitting them into a list
+        for i, line in enumerate(io.StringIO(masked_text), 1):
+            print(f"  {i:2d}: {line.rstrip()}")
     else:
         print_status("error", f"No .env file found at: {env_file}")
         return False
@@ -62,51 +117,39 @@ def check_environment_variables():
     # Check if dotenv is available and load .env file
     try:
         from dotenv import load_dotenv
-        project_root = Path(__file__).parent.parent.parent
-        env_file = project_root / ".env"
-        if env_file.exists():
-            load_dotenv(env_file)
+        env_file = ENV_FILE
+        env_text = read_env_file(str(env_file))
+        if env_text is not None:
+            # Parse the text check_env_file already read instead of reopening the file
+            load_dotenv(stream=io.StringIO(env_text))
             print_status("success", f"Loaded .env file from: {env_file}")
         else:
             print_status("info", "No .env file to load")
     except ImportError:
         print_status("warning", "dotenv not available, skipping .env file loading")
 
-    # Core configuration
-    storage_backend = os.getenv('MCP_MEMORY_STORAGE_BACKEND', 'NOT SET')
+    # Core configuration; os.environ is bound once for the lookups below
+    env = os.environ
+    storage_backend = env.get('MCP_MEMORY_STORAGE_BACKEND', 'NOT SET')
     print(f"\nCore Configuration:")
     print(f"  MCP_MEMORY_STORAGE_BACKEND: {storage_backend}")
 
-    # Cloudflare variables
-    cloudflare_vars = {
-        'CLOUDFLARE_API_TOKEN': 'REQUIRED',
-        'CLOUDFLARE_ACCOUNT_ID': 'REQUIRED',
-        'CLOUDFLARE_VECTORIZE_INDEX': 'REQUIRED',
-        'CLOUDFLARE_D1_DATABASE_ID': 'REQUIRED',
-        'CLOUDFLARE_R2_BUCKET': 'OPTIONAL',
-        'CLOUDFLARE_EMBEDDING_MODEL': 'OPTIONAL',
-        'CLOUDFLARE_LARGE_CONTENT_THRESHOLD': 'OPTIONAL',
-        'CLOUDFLARE_MAX_RETRIES': 'OPTIONAL',
-        'CLOUDFLARE_BASE_DELAY': 'OPTIONAL'
-    }
-
     print(f"\nCloudflare Configuration:")
     missing_required = []
-    for var, requirement in cloudflare_vars.items():
-        value = os.getenv(var)
+    for var in REQUIRED_CLOUDFLARE_VARS:
+        value = env.get(var)
+        if value:
+            print_status("success", f"{var}: {display_env_value(var, value)} (REQUIRED)")
+        else:
+            print_status("error", f"{var}: NOT SET (REQUIRED)")
+            missing_required.append(var)
+
+    for var in OPTIONAL_CLOUDFLARE_VARS:
+        value = env.get(var)
         if value:
-            if 'TOKEN' in var:
-                display_value = f"{value[:8]}***MASKED***"
-            else:
-                display_value = value
-            print_status("success", f"{var}: {display_value} ({requirement})")
+            print_status("success", f"{var}: {display_env_value(var, value)} (OPTIONAL)")
         else:
-            display_value = "NOT SET"
-            if requirement == 'REQUIRED':
-                print_status("error", f"{var}: {display_value} ({requirement})")
-                missing_required.append(var)
-            else:
-                print_status("warning", f"{var}: {display_value} ({requirement})")
+            print_status("warning", f"{var}: NOT SET (OPTIONAL)")
 
     if missing_required:
         print_status("error", f"Missing required Cloudflare variables: {', '.join(missing_required)}")
@@ -200,10 +243,20 @@ def test_storage_creation():
         print_status("error", f"Storage creation failed: {e}")
         import traceback
         print(f"Full traceback:")
+        sys.stdout.flush()
         traceback.print_exc()
         return None
 
 def main():
+    """Run all diagnostic tests, writing each section's output at once."""
+    buffer = SectionBuffer(sys.stdout)
+    try:
+        with contextlib.redirect_stdout(buffer):
+            run_diagnostics()
+    finally:
+        buffer.flush()
+
+def run_diagnostics():
     """Run all diagnostic tests."""
     print("MCP Memory Service Backend Configuration Diagnostics")
     print("=" * 60)
@@ -15,63 +15,154 @@ Consolidates functionality from validate_config.py and validate_configuration.py
 
 import os
 import sys
+import functools
 import json
 import re
-import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
-logger = logging.getLogger(__name__)
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson not available, the Claude Code config is parsed in full
+    ijson = None
+
+# Repository root (this script lives in scripts/validation/)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Per-user configuration locations, resolved once at import
+HOME = Path.home()
+
+# Platform-specific Claude Desktop config paths
+if os.name == 'nt':  # Windows
+    CLAUDE_DESKTOP_CONFIG_FILE = HOME / 'AppData' / 'Roaming' / 'Claude' / 'claude_desktop_config.json'
+else:  # macOS/Linux
+    CLAUDE_DESKTOP_CONFIG_FILE = HOME / '.config' / 'claude' / 'claude_desktop_config.json'
+
+# Claude Code global config (different from Claude Desktop)
+CLAUDE_CODE_CONFIG_FILE = HOME / '.claude.json'
+
+# Memory server summary of the Claude Code config, reused while that file is unchanged
+CLAUDE_CODE_CACHE_FILE = HOME / '.cache' / 'mcp-memory-service' / 'claude_code_memory_servers.json'
+
+# Any letter or digit; searched in C instead of looping over the token in Python
+ALPHANUMERIC_PATTERN = re.compile(r'[^\W_]')
+
+# Known placeholder/invalid API tokens, built once rather than on every check
+INVALID_API_TOKENS = frozenset((
+    'your_token_here',
+    'replace_with_token',
+    'mkdXbb-iplcHNBRQ5tfqV3Sh_7eALYBpO4e3Di1m',  # Known invalid token
+))
+
+# Required environment variables for Cloudflare backend
+REQUIRED_VARS = (
+    'MCP_MEMORY_STORAGE_BACKEND',
+    'CLOUDFLARE_API_TOKEN',
+    'CLOUDFLARE_ACCOUNT_ID',
+    'CLOUDFLARE_D1_DATABASE_ID',
+    'CLOUDFLARE_VECTORIZE_INDEX',
+)
+
+# Optional but commonly used variables
+OPTIONAL_VARS = (
+    'MCP_MEMORY_BACKUPS_PATH',
+    'MCP_MEMORY_SQLITE_PATH',
+)
+
+# One KEY=value assignment per line; comments and blank lines never match
+ENV_ASSIGNMENT_PATTERN = re.compile(r'^[ \t]*(?P<key>[^#=\s][^=\n]*)=(?P<value>.*)$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file once per modification time."""
+    # Read the file in one call and let the parser decode the bytes
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file_cached(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse the assignments in a .env file once per modification time."""
+    with open(path, 'r', encoding='utf-8') as f:
+        env_text = f.read()
+    # Pick out every assignment in one scan of the file
+    return {
+        match.group('key').strip(): match.group('value').strip()
+        for match in ENV_ASSIGNMENT_PATTERN.finditer(env_text)
+    }
+
+@functools.lru_cache(maxsize=16)
+def _validate_api_token_format(token: str) -> Tuple[bool, str]:
+    """Check a token's format once; .env and Claude Desktop usually share it."""
+    if not token or token == '<MISSING>':
+        return False, "Token is missing"
+
+    if len(token) < 20:
+        return False, "Token appears too short"
+
+    if not ALPHANUMERIC_PATTERN.search(token):
+        return False, "Token should contain alphanumeric characters"
+
+    # Check for known placeholder/invalid tokens
+    if token in INVALID_API_TOKENS:
+        return False, "Token appears to be a placeholder or known invalid token"
+
+    return True, "Token format appears valid"
+
+class Severity(IntEnum):
+    """Severity of a single validation result."""
+    SUCCESS = 0
+    WARNING = 1
+    ERROR = 2
 
 class ComprehensiveConfigValidator:
     """Unified configuration validator for all MCP Memory Service configurations."""
 
     def __init__(self):
         """Initialize validator with all configuration paths and requirements."""
-        self.project_root = Path(__file__).parent.parent.parent
+        self.project_root = PROJECT_ROOT
         self.env_file = self.project_root / '.env'
 
-        # Platform-specific Claude Desktop config paths
-        if os.name == 'nt':  # Windows
-            self.claude_desktop_config_file = Path.home() / 'AppData' / 'Roaming' / 'Claude' / 'claude_desktop_config.json'
-        else:  # macOS/Linux
-            self.claude_desktop_config_file = Path.home() / '.config' / 'claude' / 'claude_desktop_config.json'
-
-        # Claude Code global config (different from Claude Desktop)
-        self.claude_code_config_file = Path.home() / '.claude.json'
+        self.claude_desktop_config_file = CLAUDE_DESKTOP_CONFIG_FILE
+        self.claude_code_config_file = CLAUDE_CODE_CONFIG_FILE
+        self.claude_code_cache_file = CLAUDE_CODE_CACHE_FILE
 
         # Local project MCP config (should usually not exist for memory service)
         self.local_mcp_config_file = self.project_root / '.mcp.json'
 
-        # Required environment variables for Cloudflare backend
-        self.required_vars = [
-            'MCP_MEMORY_STORAGE_BACKEND',
-            'CLOUDFLARE_API_TOKEN',
-            'CLOUDFLARE_ACCOUNT_ID',
-            'CLOUDFLARE_D1_DATABASE_ID',
-            'CLOUDFLARE_VECTORIZE_INDEX'
-        ]
-
-        # Optional but commonly used variables
-        self.optional_vars = [
-            'MCP_MEMORY_BACKUPS_PATH',
-            'MCP_MEMORY_SQLITE_PATH'
-        ]
+        self.required_vars = REQUIRED_VARS
+        self.optional_vars = OPTIONAL_VARS
 
-        # Results tracking
-        self.issues = []
+        # Results tracking; issues are (Severity, message) pairs, labelled only when printed
+        self.issues: List[Tuple[Severity, str]] = []
         self.error_count = 0
         self.warning_count = 0
         self.success_count = 0
+        # Issues added since the last section was printed
+        self._pending: deque = deque()
+        # Sections run on worker threads record under the lock and collect
+        # their own pending issues so each prints as one block
+        self._lock = threading.Lock()
+        self._local = threading.local()
 
     def load_json_safe(self, file_path: Path) -> Optional[Dict]:
         """Load JSON file safely, return None if not found or invalid."""
         try:
             if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Keyed on mtime so a file edited between checks is re-read
+                return _load_json_cached(str(file_path), file_path.stat().st_mtime_ns)
         except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
             self.add_warning(f"Could not load {file_path}: {e}")
         return None
@@ -85,12 +176,8 @@ class ComprehensiveConfigValidator:
             return env_vars
 
         try:
-            with open(self.env_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip()
+            # Copy so callers never modify the cached result
+            env_vars = dict(_parse_env_file_cached(str(self.env_file), self.env_file.stat().st_mtime_ns))
         except Exception as e:
             self.add_error(f"Failed to load .env file: {e}")
 
@@ -98,28 +185,44 @@ class ComprehensiveConfigValidator:
 
     def add_error(self, message: str):
         """Add error message and increment counter."""
-        self.issues.append(f"ERROR: {message}")
-        self.error_count += 1
+        with self._lock:
+            self.issues.append((Severity.ERROR, message))
+            self.error_count += 1
+        self._section_pending().append((Severity.ERROR, message))
 
     def add_warning(self, message: str):
         """Add warning message and increment counter."""
-        self.issues.append(f"WARNING: {message}")
-        self.warning_count += 1
+        with self._lock:
+            self.issues.append((Severity.WARNING, message))
+            self.warning_count += 1
+        self._section_pending().append((Severity.WARNING, message))
 
     def add_success(self, message: str):
         """Add success message and increment counter."""
-        self.issues.append(f"SUCCESS: {message}")
-        self.success_count += 1
+        with self._lock:
+            self.issues.append((Severity.SUCCESS, message))
+            self.success_count += 1
+        self._section_pending().append((Severity.SUCCESS, message))
+
+    def _section_pending(self) -> deque:
+        """Pending issues of the section running on this thread."""
+        return getattr(self._local, 'pending', self._pending)
+
+    def _run_section(self, check) -> deque:
+        """Run a section's check on a worker thread and return its issues."""
+        self._local.pending = deque()
+        try:
+            check()
+            return self._local.pending
+        finally:
+            del self._local.pending
 
     def validate_env_file(self) -> Dict[str, str]:
         """Validate .env file configuration."""
         env_vars = self.load_env_file()
 
-        # Check for required variables
-        missing_vars = []
-        for var in self.required_vars:
-            if var not in env_vars or not env_vars[var].strip():
-                missing_vars.append(var)
+        # Check for required variables, one lookup each
+        missing_vars = [var for var in self.required_vars if not env_vars.get(var, '').strip()]
 
         if missing_vars:
             self.add_error(f"Missing required variables in .env file: {missing_vars}")
@@ -155,14 +258,12 @@ class ComprehensiveConfigValidator:
 
         self.add_success("Memory server found in Claude Desktop configuration")
 
-        # Get environment variables from memory server config
-        memory_env = memory_server.get('env', {})
+        # Get environment variables from memory server config; JSON values are
+        # coerced to strings once so later checks compare plain strings
+        memory_env = {key: str(value) for key, value in memory_server.get('env', {}).items()}
 
-        # Check required variables
-        missing_vars = []
-        for var in self.required_vars:
-            if var not in memory_env or not str(memory_env[var]).strip():
-                missing_vars.append(var)
+        # Check required variables, one lookup each
+        missing_vars = [var for var in self.required_vars if not memory_env.get(var, '').strip()]
 
         if missing_vars:
             self.add_error(f"Missing required variables in Claude Desktop config: {missing_vars}")
@@ -173,35 +274,94 @@ class ComprehensiveConfigValidator:
 
     def validate_claude_code_config(self):
         """Validate Claude Code global configuration (different from Claude Desktop)."""
-        config = self.load_json_safe(self.claude_code_config_file)
+        # Check for memory server configurations in projects
+        memory_configs = self._load_claude_code_memory_configs()
 
-        if not config:
+        if memory_configs is None:
             self.add_warning(f"Claude Code config not found at {self.claude_code_config_file} (this is optional)")
             return
 
-        # Check for memory server configurations in projects
-        memory_configs = []
-        projects = config.get('projects', {})
-
-        for project_path, project_config in projects.items():
-            mcp_servers = project_config.get('mcpServers', {})
-            if 'memory' in mcp_servers:
-                memory_config = mcp_servers['memory']
-                backend = memory_config.get('env', {}).get('MCP_MEMORY_STORAGE_BACKEND', 'unknown')
-                memory_configs.append((project_path, backend))
-
         if memory_configs:
-            cloudflare_configs = [cfg for cfg in memory_configs if cfg[1] == 'cloudflare']
-            non_cloudflare_configs = [cfg for cfg in memory_configs if cfg[1] != 'cloudflare']
+            # One pass counts the Cloudflare configs; the rest are everything else
+            cloudflare_count = sum(1 for _, backend in memory_configs if backend == 'cloudflare')
+            non_cloudflare_count = len(memory_configs) - cloudflare_count
 
-            if cloudflare_configs:
-                self.add_success(f"Found {len(cloudflare_configs)} Cloudflare memory configurations in Claude Code")
+            if cloudflare_count:
+                self.add_success(f"Found {cloudflare_count} Cloudflare memory configurations in Claude Code")
 
-            if non_cloudflare_configs:
-                self.add_warning(f"Found {len(non_cloudflare_configs)} non-Cloudflare memory configurations in Claude Code")
+            if non_cloudflare_count:
+                self.add_warning(f"Found {non_cloudflare_count} non-Cloudflare memory configurations in Claude Code")
         else:
             self.add_warning("No memory server configurations found in Claude Code (this is optional)")
 
+    def _load_claude_code_memory_configs(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        Get (project path, backend) for each memory server in the Claude Code config.
+
+        ~/.claude.json can grow to several megabytes, so the result is cached
+        alongside the file's modification time and size and only re-parsed
+        when either changes. Returns None if the config cannot be loaded.
+        """
+        try:
+            stat = self.claude_code_config_file.stat()
+        except OSError:
+            return None
+        cache_key = [str(self.claude_code_config_file), stat.st_mtime_ns, stat.st_size]
+
+        try:
+            cached = json.loads(self.claude_code_cache_file.read_bytes())
+            if cached['key'] == cache_key:
+                return [tuple(cfg) for cfg in cached['memory_configs']]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        if ijson is not None:
+            memory_configs = self._stream_claude_code_memory_configs()
+        else:
+            config = self.load_json_safe(self.claude_code_config_file)
+            memory_configs = list(self._iter_memory_server_backends(config.get('projects') or {})) if config else None
+        if memory_configs is None:
+            return None
+
+        try:
+            self.claude_code_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.claude_code_cache_file.write_text(json.dumps({'key': cache_key, 'memory_configs': memory_configs}))
+        except OSError:
+            # The cache only saves a re-parse; validation does not depend on it
+            pass
+
+        return memory_configs
+
+    def _stream_claude_code_memory_configs(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        Extract the memory server backends from the Claude Code config with ijson.
+
+        Projects are parsed one at a time, so the per-project history that
+        makes up most of the file is never held as a single document.
+        """
+        try:
+            with open(self.claude_code_config_file, 'rb') as f:
+                return list(self._iter_memory_server_backends(ijson.kvitems(f, 'projects')))
+        except (ijson.JSONError, OSError) as e:
+            self.add_warning(f"Could not load {self.claude_code_config_file}: {e}")
+            return None
+
+    @staticmethod
+    def _iter_memory_server_backends(projects) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (project path, storage backend) for each project with a memory server.
+
+        Accepts a projects mapping or an iterable of (path, config) pairs.
+        """
+        if isinstance(projects, dict):
+            projects = projects.items()
+        for project_path, project_config in projects:
+            # Most projects define no MCP servers; membership tests skip them
+            # without building a default dict for each one
+            if 'mcpServers' in project_config and 'memory' in project_config['mcpServers']:
+                env = project_config['mcpServers']['memory'].get('env') or {}
+                yield project_path, env.get('MCP_MEMORY_STORAGE_BACKEND', 'unknown')
+
     def validate_local_mcp_config(self):
         """Check for conflicting local .mcp.json files."""
         if self.local_mcp_config_file.exists():
@@ -219,43 +379,26 @@ class ComprehensiveConfigValidator:
             self.add_error("Cannot compare configurations - Claude Desktop config not available")
             return
 
-        # Compare each required variable
-        differences = []
-        for var in self.required_vars:
-            env_value = env_config.get(var, '<MISSING>')
-            claude_value = str(claude_desktop_config.get(var, '<MISSING>'))
+        # Matching configs are the common case, so settle that before
+        # collecting any differences
+        if all(env_config.get(var, '<MISSING>') == claude_desktop_config.get(var, '<MISSING>')
+               for var in self.required_vars):
+            self.add_success("All configurations match between .env and Claude Desktop config")
+            return
 
-            if env_value != claude_value:
-                differences.append((var, env_value, claude_value))
+        differences = {
+            var: (env_config.get(var, '<MISSING>'), claude_desktop_config.get(var, '<MISSING>'))
+            for var in self.required_vars
+            if env_config.get(var, '<MISSING>') != claude_desktop_config.get(var, '<MISSING>')
+        }
 
-        if differences:
-            self.add_warning(f"Found {len(differences)} configuration differences between .env and Claude Desktop config:")
-            for var, env_val, claude_val in differences:
-                self.add_warning(f"  {var}: .env='{env_val[:50]}...' vs Claude='{claude_val[:50]}...'")
-        else:
-            self.add_success("All configurations match between .env and Claude Desktop config")
+        self.add_warning(f"Found {len(differences)} configuration differences between .env and Claude Desktop config:")
+        for var, (env_val, claude_val) in differences.items():
+            self.add_warning(f"  {var}: .env='{env_val[:50]}...' vs Claude='{claude_val[:50]}...'")
 
     def validate_api_token_format(self, token: str) -> Tuple[bool, str]:
         """Validate API token format and detect known invalid tokens."""
-        if not token or token == '<MISSING>':
-            return False, "Token is missing"
-
-        if len(token) < 20:
-            return False, "Token appears too short"
-
-        if not any(c.isalnum() for c in token):
-            return False, "Token should contain alphanumeric characters"
-
-        # Check for known placeholder/invalid tokens
-        invalid_tokens = [
-            'your_token_here',
-            'replace_with_token',
-            'mkdXbb-iplcHNBRQ5tfqV3Sh_7eALYBpO4e3Di1m'  # Known invalid token
-        ]
-        if token in invalid_tokens:
-            return False, "Token appears to be a placeholder or known invalid token"
-
-        return True, "Token format appears valid"
+        return _validate_api_token_format(token)
 
     def validate_api_tokens(self, env_config: Dict[str, str], claude_desktop_config: Optional[Dict[str, str]]):
         """Validate API tokens in both configurations."""
@@ -270,7 +413,7 @@ class ComprehensiveConfigValidator:
 
         # Check Claude Desktop token
         if claude_desktop_config:
-            claude_token = str(claude_desktop_config.get('CLOUDFLARE_API_TOKEN', ''))
+            claude_token = claude_desktop_config.get('CLOUDFLARE_API_TOKEN', '')
             is_valid, message = self.validate_api_token_format(claude_token)
 
             if is_valid:
@@ -280,17 +423,19 @@ class ComprehensiveConfigValidator:
 
     def check_environment_conflicts(self):
         """Check for conflicting environment configurations."""
-        # Check for conflicting .env files
-        env_files = list(self.project_root.glob('.env*'))
+        # Check for conflicting .env files; only the names are needed, so list
+        # the directory once instead of building a Path per match
+        with os.scandir(self.project_root) as entries:
+            env_files = [entry.name for entry in entries if entry.name.startswith('.env')]
 
         # Exclude legitimate backup files
         conflicting_files = [
-            f for f in env_files
-            if f.name.endswith('.sqlite') and not f.name.endswith('.backup') and f.name != '.env.sqlite'
+            name for name in env_files
+            if name.endswith('.sqlite') and not name.endswith('.backup') and name != '.env.sqlite'
         ]
 
         if conflicting_files:
-            self.add_warning(f"Potentially conflicting environment files found: {[str(f.name) for f in conflicting_files]}")
+            self.add_warning(f"Potentially conflicting environment files found: {conflicting_files}")
         else:
             self.add_success("No conflicting environment files detected")
 
@@ -309,75 +454,82 @@ class ComprehensiveConfigValidator:
         claude_desktop_config = self.validate_claude_desktop_config()
         self._print_section_results()
 
-        # 3. Claude Code configuration validation (optional)
-        print("\n3. Claude Code Global Configuration Check:")
-        self.validate_claude_code_config()
-        self._print_section_results()
+        # Sections 3, 4 and 7 only read their own files, so they run
+        # concurrently while sections 5 and 6 work from the configs above;
+        # their results are still printed in section order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            claude_code_results = executor.submit(self._run_section, self.validate_claude_code_config)
+            local_mcp_results = executor.submit(self._run_section, self.validate_local_mcp_config)
+            conflict_results = executor.submit(self._run_section, self.check_environment_conflicts)
 
-        # 4. Local MCP configuration check
-        print("\n4. Local Project Configuration Check:")
-        self.validate_local_mcp_config()
-        self._print_section_results()
+            # 3. Claude Code configuration validation (optional)
+            print("\n3. Claude Code Global Configuration Check:")
+            self._print_section_results(claude_code_results.result())
 
-        # 5. Cross-configuration comparison
-        print("\n5. Cross-Configuration Consistency Check:")
-        self.compare_configurations(env_config, claude_desktop_config)
-        self._print_section_results()
+            # 4. Local MCP configuration check
+            print("\n4. Local Project Configuration Check:")
+            self._print_section_results(local_mcp_results.result())
 
-        # 6. API token validation
-        print("\n6. API Token Validation:")
-        self.validate_api_tokens(env_config, claude_desktop_config)
-        self._print_section_results()
+            # 5. Cross-configuration comparison
+            print("\n5. Cross-Configuration Consistency Check:")
+            self.compare_configurations(env_config, claude_desktop_config)
+            self._print_section_results()
 
-        # 7. Environment conflicts check
-        print("\n7. Environment Conflicts Check:")
-        self.check_environment_conflicts()
-        self._print_section_results()
+            # 6. API token validation
+            print("\n6. API Token Validation:")
+            self.validate_api_tokens(env_config, claude_desktop_config)
+            self._print_section_results()
+
+            # 7. Environment conflicts check
+            print("\n7. Environment Conflicts Check:")
+            self._print_section_results(conflict_results.result())
 
         # Final summary
         self._print_final_summary()
 
         return self.error_count == 0
 
-    def _print_section_results(self):
-        """Print results for the current section."""
-        # Print only new issues since last call
-        current_total = len(self.issues)
-        if hasattr(self, '_last_printed_index'):
-            start_index = self._last_printed_index
-        else:
-            start_index = 0
-
-        for issue in self.issues[start_index:]:
-            print(f"   {issue}")
-
-        self._last_printed_index = current_total
+    def _print_section_results(self, pending: Optional[deque] = None):
+        """Print results for the current section, or for a section run by _run_section."""
+        if pending is None:
+            pending = self._pending
+        # Print only new issues since last call, draining them in a single write
+        lines = []
+        while pending:
+            severity, message = pending.popleft()
+            lines.append(f"   {severity.name}: {message}\n")
+        sys.stdout.write(''.join(lines))
 
     def _print_final_summary(self):
         """Print comprehensive final summary."""
-        print("\n" + "=" * 70)
-        print("VALIDATION SUMMARY")
-        print("=" * 70)
+        # Collect the summary and write it in one call
+        lines = [
+            "\n" + "=" * 70,
+            "VALIDATION SUMMARY",
+            "=" * 70,
+        ]
 
         if self.error_count == 0:
-            print("CONFIGURATION VALIDATION PASSED!")
-            print(f"   SUCCESS: {self.success_count} checks passed")
+            lines.append("CONFIGURATION VALIDATION PASSED!")
+            lines.append(f"   SUCCESS: {self.success_count} checks passed")
             if self.warning_count > 0:
-                print(f"   WARNING: {self.warning_count} warnings (non-critical)")
-            print("\nYour MCP Memory Service configuration appears to be correct.")
-            print("You should be able to use the memory service with Cloudflare backend.")
+                lines.append(f"   WARNING: {self.warning_count} warnings (non-critical)")
+            lines.append("\nYour MCP Memory Service configuration appears to be correct.")
+            lines.append("You should be able to use the memory service with Cloudflare backend.")
         else:
-            print("CONFIGURATION VALIDATION FAILED!")
-            print(f"   ERROR: {self.error_count} critical errors found")
-            print(f"   WARNING: {self.warning_count} warnings")
-            print(f"   SUCCESS: {self.success_count} checks passed")
-            print("\nPlease fix the critical errors above before using the memory service.")
-
-        print(f"\nConfiguration files checked:")
-        print(f"   • .env file: {self.env_file}")
-        print(f"   • Claude Desktop config: {self.claude_desktop_config_file}")
-        print(f"   • Claude Code config: {self.claude_code_config_file}")
-        print(f"   • Local MCP config: {self.local_mcp_config_file}")
+            lines.append("CONFIGURATION VALIDATION FAILED!")
+            lines.append(f"   ERROR: {self.error_count} critical errors found")
+            lines.append(f"   WARNING: {self.warning_count} warnings")
+            lines.append(f"   SUCCESS: {self.success_count} checks passed")
+            lines.append("\nPlease fix the critical errors above before using the memory service.")
+
+        lines.append("\nConfiguration files checked:")
+        lines.append(f"   • .env file: {self.env_file}")
+        lines.append(f"   • Claude Desktop config: {self.claude_desktop_config_file}")
+        lines.append(f"   • Claude Code config: {self.claude_code_config_file}")
+        lines.append(f"   • Local MCP config: {self.local_mcp_config_file}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     """Main validation function."""
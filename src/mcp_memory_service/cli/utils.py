@@ -16,40 +16,34 @@
 CLI utilities for MCP Memory Service.
 """
 
+import functools
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from ..storage.base import MemoryStorage
 
 
-async def get_storage(backend: Optional[str] = None) -> MemoryStorage:
+@functools.lru_cache(maxsize=None)
+def _load_backend(backend: str) -> Callable[[], MemoryStorage]:
     """
-    Get storage backend for CLI operations.
+    Import a storage backend and return a factory for it.
+    
+    Only the requested backend's module is imported, and only once per process.
     
     Args:
-        backend: Storage backend name ('sqlite_vec', 'chromadb', or 'cloudflare')
+        backend: Lower-cased storage backend name
         
     Returns:
-        Initialized storage backend
+        Callable creating an uninitialized storage instance
     """
-    # Determine backend
-    if backend is None:
-        backend = os.getenv('MCP_MEMORY_STORAGE_BACKEND', 'sqlite_vec').lower()
-    
-    backend = backend.lower()
-    
     if backend in ('sqlite_vec', 'sqlite-vec'):
         from ..storage.sqlite_vec import SqliteVecMemoryStorage
         from ..config import SQLITE_VEC_PATH
-        storage = SqliteVecMemoryStorage(SQLITE_VEC_PATH)
-        await storage.initialize()
-        return storage
+        return functools.partial(SqliteVecMemoryStorage, SQLITE_VEC_PATH)
     elif backend == 'chromadb':
         from ..storage.chroma import ChromaMemoryStorage
         from ..config import CHROMA_PATH
-        storage = ChromaMemoryStorage(CHROMA_PATH)
-        await storage.initialize()
-        return storage
+        return functools.partial(ChromaMemoryStorage, CHROMA_PATH)
     elif backend == 'cloudflare':
         from ..storage.cloudflare import CloudflareStorage
         from ..config import (
@@ -59,7 +53,8 @@ async def get_storage(backend: Optional[str] = None) -> MemoryStorage:
             CLOUDFLARE_LARGE_CONTENT_THRESHOLD, CLOUDFLARE_MAX_RETRIES,
             CLOUDFLARE_BASE_DELAY
         )
-        storage = CloudflareStorage(
+        return functools.partial(
+            CloudflareStorage,
             api_token=CLOUDFLARE_API_TOKEN,
             account_id=CLOUDFLARE_ACCOUNT_ID,
             vectorize_index=CLOUDFLARE_VECTORIZE_INDEX,
@@ -70,7 +65,24 @@ async def get_storage(backend: Optional[str] = None) -> MemoryStorage:
             max_retries=CLOUDFLARE_MAX_RETRIES,
             base_delay=CLOUDFLARE_BASE_DELAY
         )
-        await storage.initialize()
-        return storage
     else:
-        raise ValueError(f"Unsupported storage backend: {backend}")
\ No newline at end of file
+        raise ValueError(f"Unsupported storage backend: {backend}")
+
+
+async def get_storage(backend: Optional[str] = None) -> MemoryStorage:
+    """
+    Get storage backend for CLI operations.
+    
+    Args:
+        backend: Storage backend name ('sqlite_vec', 'chromadb', or 'cloudflare')
+        
+    Returns:
+        Initialized storage backend
+    """
+    # Determine backend
+    if backend is None:
+        backend = os.getenv('MCP_MEMORY_STORAGE_BACKEND', 'sqlite_vec').lower()
+    
+    storage = _load_backend(backend.lower())()
+    await storage.initialize()
+    return storage
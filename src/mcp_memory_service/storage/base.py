@@ -18,7 +18,7 @@ Copyright (c) 2024 Heinrich Krupp
 Licensed under the MIT License. See LICENSE file in the project root for full license text.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Set, Iterable
 from datetime import datetime
 from ..models.memory import Memory, MemoryQueryResult
 
@@ -35,6 +35,15 @@ class MemoryStorage(ABC):
         """Store a memory. Returns (success, message)."""
         pass
     
+    async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+        """
+        Store several memories. Returns a (success, message) tuple per memory.
+
+        Backends that can write in bulk should override this; the default
+        stores each memory in turn.
+        """
+        return [await self.store(memory) for memory in memories]
+
     @abstractmethod
     async def retrieve(self, query: str, n_results: int = 5) -> List[MemoryQueryResult]:
         """Retrieve memories by semantic search."""
@@ -146,6 +155,60 @@ class MemoryStorage(ABC):
         """
         return []
     
+    async def get_all_content_hashes(self, since: Optional[float] = None) -> Set[str]:
+        """
+        Get the content hashes of all memories in storage.
+
+        Backends should override this to fetch only the hash column; the
+        default implementation loads every memory.
+
+        Args:
+            since: Only include memories created after this Unix timestamp
+
+        Returns:
+            Set of content hashes
+        """
+        memories = await self.get_all_memories()
+        return {
+            memory.content_hash for memory in memories
+            if since is None or (memory.created_at or 0) > since
+        }
+
+    async def get_content_hashes_after_id(self, after_id: int = 0) -> Tuple[Set[str], Optional[int]]:
+        """
+        Get the content hashes of memories stored after a given row id.
+
+        Row ids only ever increase, so a caller can keep the returned id and
+        later ask for just the memories stored since. Backends without
+        sequential row ids return every hash and None.
+
+        Args:
+            after_id: Only include memories with a row id above this one
+
+        Returns:
+            Tuple of (content hashes, highest row id seen or None)
+        """
+        return await self.get_all_content_hashes(), None
+
+    async def get_memories_by_content(self, contents: Iterable[str]) -> List[Memory]:
+        """
+        Get the stored memories whose content exactly matches one of the given strings.
+
+        Backends should override this to look up only the given contents; the
+        default implementation loads every memory.
+
+        Args:
+            contents: Memory contents to look up
+
+        Returns:
+            List of matching Memory objects
+        """
+        contents = set(contents)
+        if not contents:
+            return []
+        memories = await self.get_all_memories()
+        return [memory for memory in memories if memory.content in contents]
+
     async def count_all_memories(self, memory_type: Optional[str] = None) -> int:
         """
         Get total count of memories in storage.
@@ -22,7 +22,7 @@ import logging
 import hashlib
 import asyncio
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set, Iterable
 from datetime import datetime
 import httpx
 
@@ -1098,6 +1098,100 @@ class CloudflareStorage(MemoryStorage):
             logger.error(f"Error getting all memories: {str(e)}")
             return []
 
+    async def get_all_content_hashes(self, since: Optional[float] = None) -> Set[str]:
+        """
+        Get the content hashes of all memories without loading their content.
+
+        Args:
+            since: Only include memories created after this Unix timestamp
+
+        Returns:
+            Set of content hashes
+        """
+        try:
+            if since is None:
+                payload = {"sql": "SELECT content_hash FROM memories", "params": []}
+            else:
+                payload = {"sql": "SELECT content_hash FROM memories WHERE created_at > ?", "params": [since]}
+            response = await self._retry_request("POST", f"{self.d1_url}/query", json=payload)
+            result = response.json()
+
+            if not result.get("success"):
+                raise ValueError(f"D1 query failed: {result}")
+
+            rows = result.get("result", [{}])[0].get("results") or []
+            return {row["content_hash"] for row in rows}
+
+        except Exception as e:
+            logger.error(f"Error getting content hashes: {str(e)}")
+            return set()
+
+    async def get_content_hashes_after_id(self, after_id: int = 0) -> Tuple[Set[str], Optional[int]]:
+        """
+        Get the content hashes of memories stored after a given D1 row id.
+
+        The D1 memories table uses AUTOINCREMENT, so every memory stored later
+        has a higher id.
+
+        Args:
+            after_id: Only include memories with a row id above this one
+
+        Returns:
+            Tuple of (content hashes, highest row id seen), or (empty set, None) on error
+        """
+        try:
+            payload = {"sql": "SELECT id, content_hash FROM memories WHERE id > ?", "params": [after_id]}
+            response = await self._retry_request("POST", f"{self.d1_url}/query", json=payload)
+            result = response.json()
+
+            if not result.get("success"):
+                raise ValueError(f"D1 query failed: {result}")
+
+            rows = result.get("result", [{}])[0].get("results") or []
+            last_id = max((row["id"] for row in rows), default=after_id)
+            return {row["content_hash"] for row in rows}, max(last_id, after_id)
+
+        except Exception as e:
+            logger.error(f"Error getting content hashes: {str(e)}")
+            return set(), None
+
+    async def get_memories_by_content(self, contents: Iterable[str]) -> List[Memory]:
+        """
+        Get the stored memories whose content exactly matches one of the given strings.
+
+        Content offloaded to R2 is stored in D1 as a placeholder, so those
+        memories are only found by their content hash.
+
+        Args:
+            contents: Memory contents to look up
+
+        Returns:
+            List of matching Memory objects (empty on error)
+        """
+        contents = list(set(contents))
+        try:
+            memories = []
+            # D1 allows at most 100 bound parameters per query
+            for start in range(0, len(contents), 100):
+                chunk = contents[start:start + 100]
+                placeholders = ",".join("?" * len(chunk))
+                payload = {"sql": f"SELECT * FROM memories WHERE content IN ({placeholders})", "params": chunk}
+                response = await self._retry_request("POST", f"{self.d1_url}/query", json=payload)
+                result = response.json()
+
+                if not result.get("success"):
+                    raise ValueError(f"D1 query failed: {result}")
+
+                for row in result.get("result", [{}])[0].get("results") or []:
+                    memory = await self._load_memory_from_row(row)
+                    if memory:
+                        memories.append(memory)
+            return memories
+
+        except Exception as e:
+            logger.error(f"Error getting memories by content: {str(e)}")
+            return []
+
     async def count_all_memories(self, memory_type: Optional[str] = None) -> int:
         """
         Get total count of memories in storage.
@@ -25,7 +25,7 @@ This implementation provides the best of both worlds:
 import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set, Iterable
 from collections import deque
 from dataclasses import dataclass
 
@@ -724,6 +724,18 @@ class HybridMemoryStorage(MemoryStorage):
         """Get all memories from primary storage."""
         return await self.primary.get_all_memories(limit=limit, offset=offset, memory_type=memory_type, tags=tags)
 
+    async def get_all_content_hashes(self, since: Optional[float] = None) -> Set[str]:
+        """Get content hashes of all memories from primary storage."""
+        return await self.primary.get_all_content_hashes(since=since)
+
+    async def get_content_hashes_after_id(self, after_id: int = 0) -> Tuple[Set[str], Optional[int]]:
+        """Get content hashes of memories stored after a row id from primary storage."""
+        return await self.primary.get_content_hashes_after_id(after_id)
+
+    async def get_memories_by_content(self, contents: Iterable[str]) -> List[Memory]:
+        """Get memories with exactly matching content from primary storage."""
+        return await self.primary.get_memories_by_content(contents)
+
     async def count_all_memories(self, memory_type: Optional[str] = None) -> int:
         """Get total count of memories from primary storage."""
         return await self.primary.count_all_memories(memory_type=memory_type)
@@ -25,7 +25,7 @@ import time
 import os
 import sys
 import platform
-from typing import List, Dict, Any, Tuple, Optional, Set, Callable
+from typing import List, Dict, Any, Tuple, Optional, Set, Callable, Iterable
 from datetime import datetime
 import asyncio
 import random
@@ -83,6 +83,7 @@ class SqliteVecMemoryStorage(MemoryStorage):
         self.db_path = db_path
         self.embedding_model_name = embedding_model
         self.conn = None
+        self._initialized = False
         self.embedding_model = None
         self.embedding_dimension = 384  # Default for all-MiniLM-L6-v2
         
@@ -167,6 +168,9 @@ class SqliteVecMemoryStorage(MemoryStorage):
 
     async def initialize(self):
         """Initialize the SQLite database with vec0 extension."""
+        if self._initialized and self.conn is not None:
+            return
+
         try:
             if not SQLITE_VEC_AVAILABLE:
                 raise ImportError("sqlite-vec is not available. Install with: pip install sqlite-vec")
@@ -338,7 +342,17 @@ SOLUTIONS:
             self.conn.execute('CREATE INDEX IF NOT EXISTS idx_content_hash ON memories(content_hash)')
             self.conn.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON memories(created_at)')
             self.conn.execute('CREATE INDEX IF NOT EXISTS idx_memory_type ON memories(memory_type)')
+            # Partial indexes for timestamp health checks; near-empty on healthy databases
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_missing_timestamps ON memories(id)
+                WHERE created_at IS NULL AND created_at_iso IS NULL
+            ''')
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_partial_timestamps ON memories(id)
+                WHERE (created_at IS NULL) != (created_at_iso IS NULL)
+            ''')
             
+            self._initialized = True
             logger.info(f"SQLite-vec storage initialized successfully with embedding dimension: {self.embedding_dimension}")
             
         except Exception as e:
@@ -464,17 +478,7 @@ SOLUTIONS:
             # Generate embedding
             embedding = self.embedding_model.encode([text], convert_to_numpy=True)[0]
             embedding_list = embedding.tolist()
-            
-            # Validate embedding
-            if not embedding_list:
-                raise ValueError("Generated embedding is empty")
-            
-            if len(embedding_list) != self.embedding_dimension:
-                raise ValueError(f"Embedding dimension mismatch: expected {self.embedding_dimension}, got {len(embedding_list)}")
-            
-            # Validate values are finite
-            if not all(isinstance(x, (int, float)) and not (x != x) and x != float('inf') and x != float('-inf') for x in embedding_list):
-                raise ValueError("Embedding contains invalid values (NaN or infinity)")
+            self._validate_embedding(embedding_list)
             
             # Cache the result
             if self.enable_cache:
@@ -486,6 +490,48 @@ SOLUTIONS:
             logger.error(f"Failed to generate embedding: {str(e)}")
             raise RuntimeError(f"Failed to generate embedding: {str(e)}") from e
     
+    def _validate_embedding(self, embedding_list: List[float]) -> None:
+        """Raise ValueError if an embedding is empty, the wrong size, or not finite."""
+        if not embedding_list:
+            raise ValueError("Generated embedding is empty")
+        
+        if len(embedding_list) != self.embedding_dimension:
+            raise ValueError(f"Embedding dimension mismatch: expected {self.embedding_dimension}, got {len(embedding_list)}")
+        
+        # Validate values are finite
+        if not all(isinstance(x, (int, float)) and not (x != x) and x != float('inf') and x != float('-inf') for x in embedding_list):
+            raise ValueError("Embedding contains invalid values (NaN or infinity)")
+
+    def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts with a single model call."""
+        if not self.embedding_model:
+            raise RuntimeError("No embedding model available. Ensure sentence-transformers is installed and model is loaded.")
+        
+        try:
+            embeddings = [None] * len(texts)
+            uncached = []
+            for i, text in enumerate(texts):
+                cache_key = hash(text)
+                if self.enable_cache and cache_key in _EMBEDDING_CACHE:
+                    embeddings[i] = _EMBEDDING_CACHE[cache_key]
+                else:
+                    uncached.append(i)
+            
+            if uncached:
+                encoded = self.embedding_model.encode([texts[i] for i in uncached], convert_to_numpy=True)
+                for i, embedding in zip(uncached, encoded):
+                    embedding_list = embedding.tolist()
+                    self._validate_embedding(embedding_list)
+                    if self.enable_cache:
+                        _EMBEDDING_CACHE[hash(texts[i])] = embedding_list
+                    embeddings[i] = embedding_list
+            
+            return embeddings
+            
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {str(e)}")
+            raise RuntimeError(f"Failed to generate embeddings: {str(e)}") from e
+    
     async def store(self, memory: Memory) -> Tuple[bool, str]:
         """Store a memory in the SQLite-vec database."""
         try:
@@ -568,6 +614,117 @@ SOLUTIONS:
             logger.error(traceback.format_exc())
             return False, error_msg
     
+    async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+        """
+        Store several memories in a single transaction.
+        
+        Embeddings are generated with one model call and rows are inserted with
+        executemany, so the whole batch is committed once instead of per memory.
+        
+        Returns:
+            List of (success, message) tuples, one per input memory
+        """
+        if not memories:
+            return []
+        
+        try:
+            if not self.conn:
+                return [(False, "Database not initialized")] * len(memories)
+            
+            # Skip memories already stored or repeated within the batch
+            existing = self._existing_content_hashes([memory.content_hash for memory in memories])
+            results = []
+            to_store = []
+            for memory in memories:
+                if memory.content_hash in existing:
+                    results.append((False, "Duplicate content detected"))
+                else:
+                    existing.add(memory.content_hash)
+                    to_store.append(memory)
+                    results.append((True, "Memory stored successfully"))
+            
+            if not to_store:
+                return results
+            
+            try:
+                # Encoding a whole batch is slow, so keep it off the event loop
+                loop = asyncio.get_event_loop()
+                embeddings = await loop.run_in_executor(
+                    None, self._generate_embeddings, [memory.content for memory in to_store]
+                )
+            except Exception as e:
+                error_msg = f"Failed to generate embedding: {str(e)}"
+                return [(False, error_msg) if success else (success, message) for success, message in results]
+            
+            memory_rows = [
+                (
+                    memory.content_hash,
+                    memory.content,
+                    ",".join(memory.tags) if memory.tags else "",
+                    memory.memory_type,
+                    json.dumps(memory.metadata) if memory.metadata else "{}",
+                    memory.created_at,
+                    memory.updated_at,
+                    memory.created_at_iso,
+                    memory.updated_at_iso
+                )
+                for memory in to_store
+            ]
+            
+            def insert_batch():
+                try:
+                    self.conn.executemany('''
+                        INSERT INTO memories (
+                            content_hash, content, tags, memory_type,
+                            metadata, created_at, updated_at, created_at_iso, updated_at_iso
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', memory_rows)
+                    
+                    # executemany does not report row ids, so look them up to
+                    # key each embedding to its memory row
+                    rowids = self._rowids_by_content_hash([memory.content_hash for memory in to_store])
+                    self.conn.executemany('''
+                        INSERT INTO memory_embeddings (rowid, content_embedding)
+                        VALUES (?, ?)
+                    ''', [
+                        (rowids[memory.content_hash], serialize_float32(embedding))
+                        for memory, embedding in zip(to_store, embeddings)
+                    ])
+                    
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            
+            await self._execute_with_retry(insert_batch)
+            
+            logger.info(f"Successfully stored {len(to_store)} memories in batch")
+            return results
+            
+        except Exception as e:
+            error_msg = f"Failed to store memory batch: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            return [(False, error_msg)] * len(memories)
+    
+    def _existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return which of the given content hashes are already stored."""
+        return set(self._rowids_by_content_hash(content_hashes))
+    
+    def _rowids_by_content_hash(self, content_hashes: List[str]) -> Dict[str, int]:
+        """Map stored content hashes to their memory row ids."""
+        rowids = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(content_hashes), 500):
+            chunk = content_hashes[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                f'SELECT content_hash, id FROM memories WHERE content_hash IN ({placeholders})',
+                chunk
+            )
+            rowids.update(cursor.fetchall())
+        return rowids
+    
     async def retrieve(self, query: str, n_results: int = 5) -> List[MemoryQueryResult]:
         """Retrieve memories using semantic search."""
         try:
@@ -1589,6 +1746,131 @@ SOLUTIONS:
         """
         return await self.get_all_memories(limit=n, offset=0)
 
+    async def get_all_content_hashes(self, since: Optional[float] = None) -> Set[str]:
+        """
+        Get the content hashes of all memories without loading their content.
+
+        Args:
+            since: Only include memories created after this Unix timestamp
+
+        Returns:
+            Set of content hashes
+        """
+        try:
+            await self.initialize()
+
+            if since is None:
+                cursor = self.conn.execute('SELECT content_hash FROM memories')
+            else:
+                cursor = self.conn.execute('SELECT content_hash FROM memories WHERE created_at > ?', (since,))
+            return {row[0] for row in cursor}
+
+        except Exception as e:
+            logger.error(f"Error getting content hashes: {str(e)}")
+            return set()
+
+    async def get_content_hashes_after_id(self, after_id: int = 0) -> Tuple[Set[str], Optional[int]]:
+        """
+        Get the content hashes of memories stored after a given row id.
+
+        The memories table uses AUTOINCREMENT, so row ids are never reused and
+        every memory stored later has a higher id.
+
+        Args:
+            after_id: Only include memories with a row id above this one
+
+        Returns:
+            Tuple of (content hashes, highest row id seen), or (empty set, None) on error
+        """
+        try:
+            await self.initialize()
+
+            cursor = self.conn.execute('SELECT id, content_hash FROM memories WHERE id > ?', (after_id,))
+            content_hashes = set()
+            last_id = after_id
+            for row_id, content_hash in cursor:
+                content_hashes.add(content_hash)
+                last_id = max(last_id, row_id)
+            return content_hashes, last_id
+
+        except Exception as e:
+            logger.error(f"Error getting content hashes: {str(e)}")
+            return set(), None
+
+    async def get_memories_by_content(self, contents: Iterable[str]) -> List[Memory]:
+        """
+        Get the stored memories whose content exactly matches one of the given strings.
+        
+        Args:
+            contents: Memory contents to look up
+            
+        Returns:
+            List of matching Memory objects (empty on error)
+        """
+        contents = list(set(contents))
+        try:
+            await self.initialize()
+            
+            memories = []
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(contents), 500):
+                chunk = contents[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self.conn.execute(f'''
+                    SELECT content_hash, content, tags, memory_type, metadata,
+                           created_at, updated_at, created_at_iso, updated_at_iso
+                    FROM memories
+                    WHERE content IN ({placeholders})
+                ''', chunk)
+                for row in cursor:
+                    memory = self._row_to_memory(row)
+                    if memory:
+                        memories.append(memory)
+            return memories
+            
+        except Exception as e:
+            logger.error(f"Error getting memories by content: {str(e)}")
+            return []
+
+    async def get_missing_content_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """
+        Get which of the given content hashes are not stored.
+        
+        The set difference is computed in SQL against a temporary table, so
+        only the missing hashes are returned to Python.
+        
+        Args:
+            content_hashes: Content hashes to check
+            
+        Returns:
+            Set of the given content hashes with no stored memory
+        """
+        content_hashes = set(content_hashes)
+        try:
+            await self.initialize()
+            
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS candidate_hashes (content_hash TEXT PRIMARY KEY)')
+            self.conn.execute('DELETE FROM candidate_hashes')
+            self.conn.executemany(
+                'INSERT INTO candidate_hashes (content_hash) VALUES (?)',
+                ((content_hash,) for content_hash in content_hashes)
+            )
+            cursor = self.conn.execute('''
+                SELECT c.content_hash
+                FROM candidate_hashes c
+                LEFT JOIN memories m ON m.content_hash = c.content_hash
+                WHERE m.id IS NULL
+            ''')
+            missing = {row[0] for row in cursor}
+            self.conn.execute('DELETE FROM candidate_hashes')
+            self.conn.commit()
+            return missing
+            
+        except Exception as e:
+            logger.error(f"Error checking for missing content hashes: {str(e)}")
+            # Treat every hash as missing so callers fall back to their own checks
+            return content_hashes
+
     async def count_all_memories(self, memory_type: Optional[str] = None) -> int:
         """
         Get total count of memories in storage.
@@ -1619,4 +1901,5 @@ SOLUTIONS:
         if self.conn:
             self.conn.close()
             self.conn = None
+            self._initialized = False
             logger.info("SQLite-vec storage connection closed")
\ No newline at end of file
@@ -8,6 +8,7 @@ import tempfile
 import os
 import shutil
 import json
+import sqlite3
 from unittest.mock import Mock, patch
 import time
 
@@ -559,6 +560,139 @@ class TestSqliteVecStorage:
             )
             assert cursor.fetchone() is not None
 
+    def _make_memory(self, content, **kwargs):
+        """Create a memory whose hash matches its content."""
+        return Memory(content=content, content_hash=generate_content_hash(content), **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_store_batch(self, storage):
+        """Test batch storage skips duplicates and keys embeddings to their rows."""
+        existing = self._make_memory("Batch memory stored beforehand")
+        await storage.store(existing)
+
+        first = self._make_memory("First batch memory")
+        second = self._make_memory("Second batch memory")
+        repeated = self._make_memory("First batch memory")
+
+        results = await storage.store_batch([first, existing, second, repeated])
+
+        assert [success for success, _ in results] == [True, False, True, False]
+        assert "Duplicate" in results[1][1]
+        assert "Duplicate" in results[3][1]
+        assert await storage.count_all_memories() == 3
+
+        # Each embedding row must belong to the memory row with the same id
+        rowids = storage._rowids_by_content_hash([first.content_hash, second.content_hash])
+        assert set(rowids) == {first.content_hash, second.content_hash}
+        for memory in (first, second):
+            cursor = storage.conn.execute(
+                'SELECT content_embedding FROM memory_embeddings WHERE rowid = ?',
+                (rowids[memory.content_hash],)
+            )
+            stored_embedding = cursor.fetchone()[0]
+            expected_embedding = storage._generate_embeddings([memory.content])[0]
+            assert stored_embedding == sqlite_vec.serialize_float32(expected_embedding)
+
+    @pytest.mark.asyncio
+    async def test_store_batch_empty(self, storage):
+        """Test batch storage of no memories."""
+        assert await storage.store_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_store_batch_rolls_back_on_failure(self, storage):
+        """Test a failing item leaves none of the batch stored."""
+        memories = [self._make_memory(f"Rollback batch memory {i}") for i in range(3)]
+
+        valid_embedding = [0.1] * storage.embedding_dimension
+        embeddings = [valid_embedding, valid_embedding, [0.1] * (storage.embedding_dimension + 1)]
+        with patch.object(storage, '_generate_embeddings', return_value=embeddings):
+            results = await storage.store_batch(memories)
+
+        assert all(not success for success, _ in results)
+        assert await storage.count_all_memories() == 0
+        cursor = storage.conn.execute('SELECT COUNT(*) FROM memory_embeddings')
+        assert cursor.fetchone()[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_rowids_by_content_hash(self, storage, sample_memory):
+        """Test row ids are returned only for stored content hashes."""
+        await storage.store(sample_memory)
+
+        rowids = storage._rowids_by_content_hash([sample_memory.content_hash, "missing_hash"])
+
+        cursor = storage.conn.execute('SELECT id FROM memories WHERE content_hash = ?', (sample_memory.content_hash,))
+        assert rowids == {sample_memory.content_hash: cursor.fetchone()[0]}
+
+    @pytest.mark.asyncio
+    async def test_get_all_content_hashes(self, storage):
+        """Test content hashes can be fetched in full or since a timestamp."""
+        now = time.time()
+        old_memory = self._make_memory("Memory created a day ago", created_at=now - 86400)
+        new_memory = self._make_memory("Memory created just now", created_at=now)
+        await storage.store(old_memory)
+        await storage.store(new_memory)
+
+        assert await storage.get_all_content_hashes() == {old_memory.content_hash, new_memory.content_hash}
+        assert await storage.get_all_content_hashes(since=now - 3600) == {new_memory.content_hash}
+        assert await storage.get_all_content_hashes(since=now + 3600) == set()
+
+    @pytest.mark.asyncio
+    async def test_get_content_hashes_after_id(self, storage):
+        """Test content hashes can be fetched incrementally by row id."""
+        first = self._make_memory("First memory by row id")
+        await storage.store(first)
+
+        hashes, last_id = await storage.get_content_hashes_after_id()
+        assert hashes == {first.content_hash}
+
+        second = self._make_memory("Second memory by row id")
+        await storage.store(second)
+
+        new_hashes, new_last_id = await storage.get_content_hashes_after_id(last_id)
+        assert new_hashes == {second.content_hash}
+        assert new_last_id > last_id
+
+        # Nothing stored since, so the id is kept
+        assert await storage.get_content_hashes_after_id(new_last_id) == (set(), new_last_id)
+
+    @pytest.mark.asyncio
+    async def test_get_missing_content_hashes(self, storage, sample_memory):
+        """Test only hashes without a stored memory are reported missing."""
+        await storage.store(sample_memory)
+
+        missing = await storage.get_missing_content_hashes([sample_memory.content_hash, "missing_1", "missing_2"])
+        assert missing == {"missing_1", "missing_2"}
+
+        # The temporary table is emptied, so a second check starts clean
+        assert await storage.get_missing_content_hashes(["missing_3"]) == {"missing_3"}
+        assert await storage.get_missing_content_hashes([]) == set()
+
+    @pytest.mark.asyncio
+    async def test_get_missing_content_hashes_on_error(self, storage, sample_memory):
+        """Test every hash is reported missing when the check fails."""
+        await storage.store(sample_memory)
+
+        content_hashes = [sample_memory.content_hash, "missing_hash"]
+        with patch.object(storage, 'conn') as conn:
+            conn.execute.side_effect = sqlite3.OperationalError("simulated failure")
+            missing = await storage.get_missing_content_hashes(content_hashes)
+
+        assert missing == set(content_hashes)
+
+    @pytest.mark.asyncio
+    async def test_get_memories_by_content(self, storage):
+        """Test only memories with exactly matching content are returned."""
+        first = self._make_memory("Content lookup memory", metadata={"source": "lookup"})
+        second = self._make_memory("Another content lookup memory")
+        await storage.store(first)
+        await storage.store(second)
+
+        memories = await storage.get_memories_by_content([first.content, "Content lookup", "Unknown content"])
+        assert [memory.content_hash for memory in memories] == [first.content_hash]
+        assert memories[0].metadata == {"source": "lookup"}
+
+        assert await storage.get_memories_by_content([]) == []
+
 
 class TestSqliteVecStorageWithoutEmbeddings:
     """Test SQLite-vec storage when sentence transformers is not available."""